@@ -0,0 +1,64 @@
+"""
+Parse time / peak memory per site: full html.parser tree vs parsing.make_soup.
+
+Runs over every benchmarks/fixtures/<site>/<name>.html (site = amazon |
+moglix | industrybuying) plus one bench_pipeline.synthetic page per site
+padded to --page-kb, so there is always something to measure:
+
+    python benchmarks/bench_parsing.py [--fixtures DIR] [--repeat N] [--page-kb 300]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+from bench_pipeline import synthetic
+from parsing import make_soup
+from sites import SITES
+
+
+def measure(fn, content, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn(content)
+        times.append(time.perf_counter() - t)
+    tracemalloc.start()
+    soup = fn(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del soup
+    return min(times), peak
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--fixtures', default=Path(__file__).parent / 'fixtures', type=Path)
+    ap.add_argument('--repeat', default=5, type=int)
+    ap.add_argument('--page-kb', default=300, type=int, help="synthetic page size (0 to skip)")
+    args = ap.parse_args()
+
+    print(f"{'site':<15}{'page':<28}{'KB':>7}{'before ms':>11}{'after ms':>10}{'before MB':>11}{'after MB':>10}")
+    found = False
+    for site in SITES:
+        pages = [(page.name, page.read_bytes()) for page in sorted((args.fixtures / site).glob('*.html'))]
+        if args.page_kb:
+            pages.append((f"synthetic {args.page_kb}KB", synthetic(site, 1, args.page_kb, False).encode()))
+        for name, content in pages:
+            found = True
+            t0, m0 = measure(lambda c: BeautifulSoup(c, 'html.parser'), content, args.repeat)
+            t1, m1 = measure(lambda c: make_soup(c, SITES[site]['parse_only']), content, args.repeat)
+            print(f"{site:<15}{name[:27]:<28}{len(content)//1024:>7}"
+                  f"{t0*1000:>11.1f}{t1*1000:>10.1f}{m0/2**20:>11.1f}{m1/2**20:>10.1f}")
+    if not found:
+        print(f"No fixture pages under {args.fixtures} and --page-kb 0 - nothing to measure")
+    sys.exit(0 if found else 1)
+
+
+if __name__ == '__main__':
+    main()
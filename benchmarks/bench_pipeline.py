@@ -0,0 +1,251 @@
+"""
+End-to-end bulk pipeline benchmark against a local mock storefront.
+
+A mock server (separate process, so its CPU and memory are not counted)
+serves product pages for every registered site, each site on its own
+loopback address (127.0.0.1, .2, .3 ... - Linux routes all of 127/8 to lo).
+Pages come from recorded benchmarks/fixtures/<site>/*.html when present
+(the committed synthetic-*.html ones are skipped), otherwise a synthetic
+page matching the site's selectors, padded to --page-kb.
+Latency, 5xx errors and Amazon 503 'Robot Check' pages are injected at the
+given rates. The sheet then runs through pipeline.run_job exactly as the
+CLI does, and the run reports rows/sec, CPU time, peak RSS and export time.
+
+    python benchmarks/bench_pipeline.py [--rows 2000] [--latency 50] [--error-rate .02]
+        [--captcha-rate .01] [--page-kb 300] [--format xlsx] [--parsers 0]
+        [--json out.json] [--baseline previous.json --tolerance .2]
+
+With --baseline the run fails (exit 1) when rows/sec drops or export time
+grows by more than --tolerance against the saved result.
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+import sites
+from exporter import ResultWriter
+from http_client import make_session
+from jobs import JobStore
+from parser_pool import ParserPool
+from pipeline import run_job
+from retry import RetryPolicy
+from scraper import MultiScraper
+from stats import STATS_COLUMNS
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+FILLER = '<div class="card"><span class="label">Customers also viewed</span><a href="#">item</a><p>{}</p></div>'
+
+
+def paths(key, i):
+    """Product path for row i, shaped so each site's sku/product_id patterns match."""
+    return {'amazon': f"/dp/B{i:09d}",
+            'industrybuying': f"/power-drill-{i}/TOO.{i}/",
+            'moglix': f"/power-drill/mp/msn{i:08d}"}.get(key, f"/product/{i}")
+
+
+def synthetic(key, i, page_kb, jsonld):
+    name, price, mrp = f"Cordless Drill Driver {i} 18V", 1000 + i % 900, 2000 + i % 900
+    imgs = ''.join(f'<img src="https://cdn.example.com/images/product/{i}-{k}._SS40_.jpg">' for k in range(5))
+    rows = ''.join(f"<tr><th>Spec {k}</th><td>Value {i % 97}-{k}</td></tr>" for k in range(20))
+    body = {
+        'amazon': f'<span id="productTitle"> {name} </span><a id="bylineInfo">Visit the Bosch Store</a>'
+                  f'<span class="a-price"><span class="a-offscreen">₹{price:,}</span></span>'
+                  f'<div id="altImages">{imgs}</div><table id="productDetails_techSpec_section_1">{rows}</table>',
+        'industrybuying': f'<h1>{name}</h1><div>Price ₹{price:,} <b>18% GST</b></div>'
+                          f'<div class="mrp">MRP ₹{mrp:,}</div>{imgs}<table>{rows}</table>',
+    }.get(key, f'<h1>{name}</h1><div>₹{price:,}</div>{imgs.replace("example", "moglix")}<table>{rows}</table>')
+    if jsonld:
+        product = {'@context': 'https://schema.org', '@type': 'Product', 'name': name, 'brand': 'Bosch',
+                   'offers': {'@type': 'Offer', 'price': price, 'priceCurrency': 'INR'}}
+        body = f'<script type="application/ld+json">{json.dumps(product)}</script>{body}'
+    page = f"<html><head><title>{name}</title></head><body>{body}"
+    filler = []
+    while len(page) + sum(map(len, filler)) < page_kb * 1024:
+        filler.append(FILLER.format('lorem ipsum dolor sit amet ' * 8))
+    return page + ''.join(filler) + '</body></html>'
+
+
+def serve(key, host, config, ports):
+    recorded = [p.read_bytes() for p in sorted((FIXTURES / key).glob('*.html'))
+                if not p.name.startswith('synthetic-')]
+    rng = random.Random(config['seed'])
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with lock:
+                roll, jitter, jsonld = rng.random(), rng.random(), rng.random() < config['jsonld']
+            time.sleep(config['latency'] / 1000 * (0.5 + jitter))
+            if key == 'amazon' and roll < config['captcha_rate']:
+                return self.reply(503, b'<html><title>Robot Check</title></html>')
+            if roll > 1 - config['error_rate']:
+                return self.reply(500, b'<html>Internal Server Error</html>')
+            i = int(''.join(c for c in self.path if c.isdigit()) or 0)
+            page = recorded[i % len(recorded)] if recorded else \
+                synthetic(key, i, config['page_kb'], jsonld).encode()
+            self.reply(200, page)
+
+        def reply(self, status, body):
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, 0), Handler)
+    server.daemon_threads = True
+    ports.put((key, server.server_address[1]))
+    server.serve_forever()
+
+
+class TimedWriter:
+    """ResultWriter wrapper adding up the seconds spent exporting."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.seconds = 0.0
+
+    def __getattr__(self, name):
+        return getattr(self.writer, name)
+
+    def _timed(self, fn, *args):
+        t = time.perf_counter()
+        out = fn(*args)
+        self.seconds += time.perf_counter() - t
+        return out
+
+    def write(self, record):
+        return self._timed(self.writer.write, record)
+
+    def write_table(self, name, columns, rows):
+        return self._timed(self.writer.write_table, name, columns, rows)
+
+    def close(self):
+        return self._timed(self.writer.close)
+
+
+def start_storefront(config):
+    ctx = multiprocessing.get_context('spawn')
+    ports = ctx.Queue()
+    hosts = {key: f"127.0.0.{n}" for n, key in enumerate(sites.SITES, 1)}
+    procs = [ctx.Process(target=serve, args=(key, host, config, ports), daemon=True) for key, host in hosts.items()]
+    for p in procs:
+        p.start()
+    bases = {}
+    for _ in procs:
+        key, port = ports.get(timeout=30)
+        bases[key] = f"http://{hosts[key]}:{port}"
+    sites.HOSTS.update({host: key for key, host in hosts.items()})
+    return bases, procs
+
+
+def compare(result, baseline, tolerance):
+    failures = []
+    if result['rows_per_sec'] < baseline['rows_per_sec'] * (1 - tolerance):
+        failures.append(f"rows/sec {result['rows_per_sec']:.1f} vs {baseline['rows_per_sec']:.1f}")
+    if result['export_s'] > baseline['export_s'] * (1 + tolerance) + 0.05:
+        failures.append(f"export {result['export_s']:.2f}s vs {baseline['export_s']:.2f}s")
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rows', default=2000, type=int)
+    ap.add_argument('--latency', default=50.0, type=float, help="mean server latency (ms)")
+    ap.add_argument('--error-rate', default=0.02, type=float, help="fraction of HTTP 500 responses")
+    ap.add_argument('--captcha-rate', default=0.01, type=float, help="fraction of Amazon 503 Robot Check pages")
+    ap.add_argument('--page-kb', default=300, type=int, help="synthetic page size")
+    ap.add_argument('--jsonld', default=0.0, type=float, help="fraction of synthetic pages carrying JSON-LD")
+    ap.add_argument('--format', default='xlsx', choices=['xlsx', 'csv', 'parquet'])
+    ap.add_argument('--workers', default=16, type=int)
+    ap.add_argument('--per-site', default=4, type=int)
+    ap.add_argument('--delay', default=0.0, type=float)
+    ap.add_argument('--parsers', default=0, type=int)
+    ap.add_argument('--retry-base', default=0.05, type=float, help="backoff base (s); production default is 1")
+    ap.add_argument('--seed', default=1, type=int)
+    ap.add_argument('--json', type=Path, help="write the result here")
+    ap.add_argument('--baseline', type=Path, help="earlier --json result to compare against")
+    ap.add_argument('--tolerance', default=0.2, type=float)
+    args = ap.parse_args()
+
+    config = {'latency': args.latency, 'error_rate': args.error_rate, 'captcha_rate': args.captcha_rate,
+              'page_kb': args.page_kb, 'jsonld': args.jsonld, 'seed': args.seed}
+    bases, procs = start_storefront(config)
+    keys = list(bases)
+    df = pd.DataFrame([{'materialId': f"M{i:07d}", 'Source': sites.SITES[keys[i % len(keys)]]['seller'],
+                        'Product URL': bases[keys[i % len(keys)]] + paths(keys[i % len(keys)], i)}
+                       for i in range(args.rows)])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        parsers = ParserPool(args.parsers) if args.parsers > 0 else None
+        scraper = MultiScraper(retry=RetryPolicy(base=args.retry_base), session=make_session(),
+                               parsers=parsers)
+        writer = TimedWriter(ResultWriter(Path(tmp) / f"bench.{args.format}", args.format))
+        job = JobStore('bench', tmp)
+
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        done = ok = 0
+        for done, total, record in run_job(df, job, scraper, writer, 'fresh', args.workers, args.per_site,
+                                           args.delay, requeue=False):
+            ok += record.ok
+        scrape_s = time.perf_counter() - wall0
+        # Not record_stats: mock-server throughput must not reach the real estimate file
+        writer.write_table('Run Stats', STATS_COLUMNS, scraper.stats.summary())
+        path = writer.close()
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+        if parsers:
+            parsers.close()
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        size_mb = Path(path).stat().st_size / 2**20
+
+    for p in procs:
+        p.terminate()
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 2**20 if sys.platform == 'darwin' else 2**10
+    result = {'rows': done, 'success': ok, 'failed': done - ok, 'scrape_s': round(scrape_s, 2),
+              'rows_per_sec': round(done / scrape_s, 1) if scrape_s else 0.0, 'wall_s': round(wall, 2),
+              'cpu_s': round(cpu, 2), 'cpu_parsers_s': round(children.ru_utime + children.ru_stime, 2),
+              'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+              'export_s': round(writer.seconds, 2), 'output_mb': round(size_mb, 2),
+              'config': {**config, 'rows': args.rows, 'format': args.format, 'workers': args.workers,
+                         'per_site': args.per_site, 'parsers': args.parsers}}
+
+    for k, v in result.items():
+        if k != 'config':
+            print(f"{k:<16}{v}")
+    print()
+    stats = pd.DataFrame(scraper.stats.summary())
+    print(stats[['site', 'rows', 'failed', 'rows_per_min', 'ttfb_p50', 'download_p50', 'parse_p50',
+                 'extract_p50', 'total_p95']].to_string(index=False))
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        failures = compare(result, json.loads(args.baseline.read_text()), args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Resident memory of N scraped rows: per-row dicts of formatted strings (the
+layout before records.Record) vs Record objects.
+
+    python benchmarks/bench_records.py [--rows N] [--specs N] [--images N]
+"""
+
+import argparse
+import gc
+import pickle
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from records import Image, Record, format_price
+
+
+def make_record(i, n_specs, n_images):
+    return Record(f"M{i:07d}", 'Amazon India', f"https://www.amazon.in/dp/B{i:09d}", 'Success',
+                  f"Cordless Drill Driver {i} 18V Brushless", 1299 + i % 500, 18, 1999 + i % 700, 'INR',
+                  'Bosch', f"B{i:09d}", 'Amazon', extraction_path='html', scraped_at='2026-01-01 10:00:00',
+                  specs=[(f"Spec {k}", f"Value {i % 97}-{k}") for k in range(n_specs)],
+                  images=[Image(f"https://m.media-amazon.com/images/I/{i}-{k}.jpg") for k in range(n_images)])
+
+
+def as_dicts(record):
+    main = record.main_rows()[0]
+    for f in ('base_price', 'final_price', 'mrp'):
+        main[f] = format_price(main[f])
+    main['gst'] = f"{main['gst']}%"
+    return {'main': main, 'specifications': record.spec_rows(), 'images': record.image_rows()}
+
+
+def resident(build, n):
+    gc.collect()
+    tracemalloc.start()
+    rows = [build(i) for i in range(n)]
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return rows, current
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--rows', default=20000, type=int)
+    ap.add_argument('--specs', default=30, type=int)
+    ap.add_argument('--images', default=5, type=int)
+    args = ap.parse_args()
+
+    def build_record(i):
+        return make_record(i, args.specs, args.images)
+
+    def build_dicts(i):
+        return as_dicts(make_record(i, args.specs, args.images))
+
+    print(f"{args.rows} rows x {args.specs} specs x {args.images} images")
+    print(f"{'model':<10}{'MB':>10}{'bytes/row':>12}{'pickled/row':>13}")
+    results = {}
+    for name, build in (('dicts', build_dicts), ('records', build_record)):
+        rows, size = resident(build, args.rows)
+        pickled = len(pickle.dumps(rows[:1000], pickle.HIGHEST_PROTOCOL)) / min(1000, len(rows))
+        results[name] = size
+        print(f"{name:<10}{size / 2**20:>10.1f}{size / args.rows:>12.0f}{pickled:>13.0f}")
+        del rows
+    print(f"records use {results['records'] / results['dicts']:.0%} of the dict layout's memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Per-site extractor check + timing over saved fixture pages.
+
+Each benchmarks/fixtures/<site>/<name>.html may have a <name>.json next to
+it holding the product URL and the expected record:
+
+    {"url": "https://www.amazon.in/dp/B0...", "main": {...}, "specs": [...], "images": [...]}
+
+synthetic-*.html pages (bench_pipeline.synthetic, with and without JSON-LD)
+ship for every site; add recorded pages beside them. Run with --update to
+(re)write the expected records from the current extractor output, then
+without it to check for regressions (exit 1 on a mismatch or no fixtures):
+
+    python benchmarks/bench_sites.py [--fixtures DIR] [--repeat N] [--update]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sites import SITES, extract
+
+VOLATILE = {'scraped_at'}
+
+
+def comparable(record):
+    data = record.to_dict()
+    data['main'] = {k: v for k, v in data['main'].items() if k not in VOLATILE}
+    return data
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--fixtures', default=Path(__file__).parent / 'fixtures', type=Path)
+    ap.add_argument('--repeat', default=5, type=int)
+    ap.add_argument('--update', action='store_true')
+    args = ap.parse_args()
+
+    print(f"{'site':<15}{'page':<28}{'ms/row':>8}  check")
+    failures, found = 0, False
+    for key, site in SITES.items():
+        for page in sorted((args.fixtures / key).glob('*.html')):
+            found = True
+            content = page.read_bytes()
+            text = content.decode('utf-8', errors='replace')
+            golden = page.with_suffix('.json')
+            expected = json.loads(golden.read_text(encoding='utf-8')) if golden.exists() else {}
+            url = expected.get('url', f"https://www.{site['hosts'][0]}/fixture")
+
+            times = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                result = extract(key, 'fixture', site['seller'], url, content, text)
+                times.append(time.perf_counter() - t)
+
+            got = comparable(result)
+            if args.update:
+                golden.write_text(json.dumps({'url': url, **got}, indent=2, ensure_ascii=False), encoding='utf-8')
+                check = 'updated'
+            elif not expected:
+                check = 'no expected record (run with --update)'
+            elif got == {k: expected.get(k) for k in got}:
+                check = 'ok'
+            else:
+                failures += 1
+                diff = [k for k in got['main'] if got['main'][k] != expected.get('main', {}).get(k)]
+                check = f"MISMATCH main:{diff} specs:{len(got['specs'])} images:{len(got['images'])}"
+            print(f"{key:<15}{page.name[:27]:<28}{min(times)*1000:>8.1f}  {check}")
+    if not found:
+        print(f"No fixture pages under {args.fixtures} - save some <site>/<name>.html pages first")
+    sys.exit(1 if failures or not found else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+BULK RUNNER - concurrent row scheduling with per-domain politeness
+==================================================================
+Rows are grouped by storefront host (subdomains folded into the SITES
+host they fall under) and each host gets its own lanes, so the delay
+between requests is enforced per site instead of globally. Finished
+results wait in a bounded queue: a slow consumer stalls the lanes rather
+than letting results pile up.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from urllib.parse import urlparse
+
+from sites import registry_host
+
+
+def domain_of(url):
+    """Politeness key for a URL: the SITES host it falls under, so m.moglix.com and moglix.com
+    share one lane set, token bucket and circuit breaker; else its host without www."""
+    registered = registry_host(url)
+    if registered:
+        return registered
+    host = urlparse(str(url).strip()).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class DomainLimiter:
+    """One token bucket per host: `delay` seconds between requests, `burst` allowed back to back."""
+
+    def __init__(self, delay=2.0, burst=1):
+        self.delay = delay
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, domain):
+        if self.delay <= 0:
+            return
+        with self.lock:
+            bucket = self.buckets.get(domain)
+            if bucket is None:
+                bucket = self.buckets[domain] = TokenBucket(1 / self.delay, self.burst)
+        bucket.acquire()
+
+
+def run_bulk(scraper, rows, workers=8, per_domain=2, delay=2.0):
+    """Scrape (idx, mid, source, url) rows concurrently, yielding (idx, result) as they complete.
+
+    Results arrive out of order; callers key them by idx.
+    """
+    lanes = {}
+    for row in rows:
+        lanes.setdefault(domain_of(row[3]), deque()).append(row)
+    total = sum(len(q) for q in lanes.values())
+    if not total:
+        return
+
+    limiter = DomainLimiter(delay)
+    done = Queue(maxsize=max(1, workers) * 4)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                done.put(item, timeout=0.5)
+                return
+            except Full:
+                pass
+
+    def lane(domain, queue):
+        # Pages still being parsed (ParserPool); the lane fetches on meanwhile
+        inflight = deque()
+
+        def hand_over(wait):
+            while inflight and (wait or scraper.ready(inflight[0][-1])):
+                idx, mid, source, url, handle = inflight.popleft()
+                try:
+                    result = scraper.finish(handle)
+                except Exception as e:
+                    result = scraper._error(mid, source, url, str(e))
+                put((idx, result))
+
+        while not stop.is_set():
+            try:
+                idx, mid, source, url = queue.popleft()
+            except IndexError:
+                break
+            try:
+                # Every attempt, retries included, waits for this site's token
+                handle = scraper.start(mid, source, url, lambda: limiter.acquire(domain))
+            except Exception as e:
+                handle = scraper._error(mid, source, url, str(e))
+            inflight.append((idx, mid, source, url, handle))
+            hand_over(wait=False)
+        hand_over(wait=True)
+
+    n_lanes = sum(min(per_domain, len(q)) for q in lanes.values())
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, n_lanes))) as pool:
+        # Interleave lane submission so every domain starts before any gets a second lane
+        for i in range(per_domain):
+            for domain, queue in lanes.items():
+                if i < len(queue):
+                    pool.submit(lane, domain, queue)
+        try:
+            for _ in range(total):
+                yield done.get()
+        finally:
+            # Consumer went away (e.g. Streamlit rerun): let lanes drain after their current row
+            stop.set()
@@ -0,0 +1,122 @@
+"""
+DELTA MODE - only export products that changed since the last run
+=================================================================
+A compact fingerprint per materialId (hash of final_price, mrp, gst, the
+spec set and the image list) is kept in SQLite per catalogue (usually the
+input file name). DeltaWriter wraps a ResultWriter: new and changed
+products are written, unchanged ones are skipped, and a Change Log sheet
+lists new/changed/disappeared/failed rows. A product has disappeared when
+its page is gone or its materialId is no longer in the sheet - not merely
+because this run did not scrape it. Fingerprints are committed on
+close, so an interrupted run is diffed again in full next time.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+TRACKED = ['final_price', 'mrp', 'gst']
+CHANGE_COLUMNS = ['materialId', 'change', 'fields', 'product_name', 'product_url', 'error_reason']
+
+
+def _digest(value):
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def fingerprint(record):
+    """(overall hash, per-part values) for a successful record."""
+    parts = {'final_price': record.price, 'mrp': record.mrp, 'gst': record.gst}
+    parts['specs'] = _digest(sorted(record.specs))
+    parts['images'] = _digest([img.url for img in record.images])
+    return _digest(parts), parts
+
+
+class FingerprintStore:
+    def __init__(self, path='.sku_cache/fingerprints.db'):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("""CREATE TABLE IF NOT EXISTS fingerprints (
+            catalogue TEXT, material_id TEXT, fingerprint TEXT, parts TEXT, product_name TEXT,
+            product_url TEXT, seen_at REAL, PRIMARY KEY (catalogue, material_id))""")
+        self.db.commit()
+
+    def load(self, catalogue):
+        rows = self.db.execute("SELECT material_id, fingerprint, parts, product_name, product_url "
+                               "FROM fingerprints WHERE catalogue = ?", (catalogue,))
+        return {mid: (fp, json.loads(parts), name, url) for mid, fp, parts, name, url in rows}
+
+    def commit(self, catalogue, upserts, removed):
+        now = time.time()
+        self.db.executemany("INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [(catalogue, mid, fp, json.dumps(parts, ensure_ascii=False), name, url, now)
+                             for mid, (fp, parts, name, url) in upserts.items()])
+        self.db.executemany("DELETE FROM fingerprints WHERE catalogue = ? AND material_id = ?",
+                            [(catalogue, mid) for mid in removed])
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+class DeltaWriter:
+    """ResultWriter stand-in that passes through only new/changed products."""
+
+    def __init__(self, writer, store, catalogue, sheet):
+        """`sheet`: every materialId in the input sheet, scraped this run or not."""
+        self.writer = writer
+        self.store = store
+        self.catalogue = catalogue
+        self.previous = store.load(catalogue)
+        self.upserts = {}
+        self.sheet = {str(mid) for mid in sheet}
+        self.log = []
+        self.changes = {'new': 0, 'changed': 0, 'unchanged': 0, 'disappeared': 0, 'failed': 0}
+        self.success = 0
+
+    @property
+    def counts(self):
+        return self.writer.counts
+
+    def write(self, record):
+        mid = str(record.materialId)
+        old = self.previous.get(mid)
+
+        if not record.ok:
+            # A product page that no longer exists is a disappearance; other failures say nothing
+            change = 'disappeared' if old and record.error_category == 'not_found' else 'failed'
+            self._log(mid, change, '', record.product_name, record.product_url, record.error_reason)
+            return
+        fp, parts = fingerprint(record)
+        if old and old[0] == fp:
+            self.changes['unchanged'] += 1
+            return
+        # Only written rows count, so success matches counts['Main Results']
+        self.success += 1
+
+        fields = '' if not old else '; '.join(
+            f"{k}: {old[1].get(k)} → {v}" if k in TRACKED else k
+            for k, v in parts.items() if old[1].get(k) != v)
+        self._log(mid, 'changed' if old else 'new', fields, record.product_name, record.product_url)
+        self.upserts[mid] = (fp, parts, record.product_name, record.product_url)
+        self.writer.write(record)
+
+    def _log(self, mid, change, fields, name, url, reason=''):
+        self.changes[change] += 1
+        self.log.append({'materialId': mid, 'change': change, 'fields': fields,
+                         'product_name': name, 'product_url': url, 'error_reason': reason})
+
+    def write_table(self, name, columns, rows):
+        self.writer.write_table(name, columns, rows)
+
+    def close(self):
+        gone = [row['materialId'] for row in self.log if row['change'] == 'disappeared']
+        removed = [mid for mid in self.previous if mid not in self.sheet]
+        for mid in removed:
+            _, _, name, url = self.previous[mid]
+            self._log(mid, 'disappeared', 'no longer in sheet', name, url)
+        removed += gone
+        self.writer.write_table('Change Log', CHANGE_COLUMNS, self.log)
+        self.store.commit(self.catalogue, self.upserts, removed)
+        return self.writer.close()
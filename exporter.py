@@ -0,0 +1,162 @@
+"""
+EXPORTER - streaming results writer
+===================================
+Rows go to disk as each result arrives (openpyxl write-only workbook,
+CSV files, or batched Parquet row groups), so memory stays flat however
+long the sheet is. Records are expanded into per-sheet rows only here;
+prices stay numeric. CSV and Parquet outputs are bundled into one zip.
+"""
+
+import csv
+import zipfile
+from pathlib import Path
+
+from openpyxl import Workbook
+
+MAIN_COLUMNS = ['materialId', 'source', 'product_url', 'product_name', 'base_price', 'gst', 'final_price',
+                'mrp', 'currency', 'brand', 'sku', 'seller_name', 'main_image_url', 'additional_images_count',
+                'status', 'error_reason', 'retries', 'error_category', 'extraction_path', 'scraped_at']
+SPEC_COLUMNS = ['materialId', 'product_name', 'specification_name', 'specification_value']
+IMAGE_COLUMNS = ['materialId', 'product_name', 'image_url', 'image_type', 'image_order', 'image_status', 'local_path']
+
+# sheet name -> (Record row method, columns)
+SHEETS = {
+    'Main Results': ('main_rows', MAIN_COLUMNS),
+    'Specifications': ('spec_rows', SPEC_COLUMNS),
+    'Images': ('image_rows', IMAGE_COLUMNS),
+}
+FORMATS = {'Excel (.xlsx)': 'xlsx', 'CSV (.zip)': 'csv', 'Parquet (.zip)': 'parquet'}
+INT_COLUMNS = {'additional_images_count', 'image_order'}
+FLOAT_COLUMNS = {'base_price', 'final_price', 'mrp', 'gst'}
+
+
+class _XlsxSink:
+    def __init__(self, path):
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        self.sheets = {}
+        for name, (_, columns) in SHEETS.items():
+            self.sheets[name] = self.wb.create_sheet(name)
+            self.sheets[name].append(columns)
+
+    def write(self, name, values):
+        self.sheets[name].append(values)
+
+    def add_table(self, name, columns, rows):
+        ws = self.wb.create_sheet(name)
+        ws.append(columns)
+        for row in rows:
+            ws.append([row.get(c) for c in columns])
+
+    def close(self):
+        self.wb.save(self.path)
+        return self.path
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self.path = path.with_suffix('.zip')
+        self.parts = {name: _part(path, name, '.csv') for name in SHEETS}
+        self.files = {name: open(p, 'w', newline='', encoding='utf-8') for name, p in self.parts.items()}
+        self.writers = {name: csv.writer(f) for name, f in self.files.items()}
+        for name, (_, columns) in SHEETS.items():
+            self.writers[name].writerow(columns)
+
+    def write(self, name, values):
+        self.writers[name].writerow(values)
+
+    def add_table(self, name, columns, rows):
+        self.parts[name] = _part(self.path, name, '.csv')
+        with open(self.parts[name], 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([row.get(c) for c in columns] for row in rows)
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        return _bundle(self.path, self.parts.values())
+
+
+class _ParquetSink:
+    BATCH = 1000
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+        self.pa = pa
+        self.pq = pq
+        self.path = path.with_suffix('.zip')
+        self.parts = {name: _part(path, name, '.parquet') for name in SHEETS}
+        self.schemas = {name: pa.schema([(c, pa.int64() if c in INT_COLUMNS else
+                                              pa.float64() if c in FLOAT_COLUMNS else pa.string()) for c in columns])
+                        for name, (_, columns) in SHEETS.items()}
+        self.writers = {name: self.pq.ParquetWriter(self.parts[name], self.schemas[name]) for name in SHEETS}
+        self.buffers = {name: [] for name in SHEETS}
+
+    def write(self, name, values):
+        columns = SHEETS[name][1]
+        self.buffers[name].append({c: (v if c in INT_COLUMNS or c in FLOAT_COLUMNS or v is None else str(v))
+                                   for c, v in zip(columns, values)})
+        if len(self.buffers[name]) >= self.BATCH:
+            self._flush(name)
+
+    def add_table(self, name, columns, rows):
+        self.parts[name] = _part(self.path, name, '.parquet')
+        self.pq.write_table(self.pa.Table.from_pylist([{c: row.get(c) for c in columns} for row in rows]),
+                            self.parts[name])
+
+    def _flush(self, name):
+        if self.buffers[name]:
+            self.writers[name].write_table(self.pa.Table.from_pylist(self.buffers[name], self.schemas[name]))
+            self.buffers[name] = []
+
+    def close(self):
+        for name, writer in self.writers.items():
+            self._flush(name)
+            writer.close()
+        return _bundle(self.path, self.parts.values())
+
+
+def _part(path, name, suffix):
+    return path.with_name(f"{path.stem}_{name.lower().replace(' ', '_')}{suffix}")
+
+
+def _bundle(path, parts):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for part in parts:
+            zf.write(part, part.name)
+            part.unlink()
+    return path
+
+
+SINKS = {'xlsx': _XlsxSink, 'csv': _CsvSink, 'parquet': _ParquetSink}
+
+
+class ResultWriter:
+    """Append scrape results to an export file as they come in; close() returns the file to download."""
+
+    def __init__(self, path, fmt='xlsx'):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.sink = SINKS[fmt](path.with_suffix('.' + fmt))
+        self.counts = {name: 0 for name in SHEETS}
+        self.success = 0
+
+    def write(self, record):
+        for name, (rows, columns) in SHEETS.items():
+            for row in getattr(record, rows)():
+                self.sink.write(name, [row.get(c) for c in columns])
+                self.counts[name] += 1
+        if record.ok:
+            self.success += 1
+
+    def write_table(self, name, columns, rows):
+        """Add a small summary table (e.g. Run Stats) as its own sheet/file."""
+        self.sink.add_table(name, columns, rows)
+
+    def close(self):
+        return self.sink.close()
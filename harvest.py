@@ -0,0 +1,98 @@
+"""
+SKU HARVESTER - headless bulk runs
+==================================
+    python harvest.py products.xlsx -o results.xlsx
+    python harvest.py products.csv -o results.parquet --workers 16 --mode failed
+
+Uses the same job checkpoints as the UI, so a sheet started in one can be
+resumed from the other (pass the same --jobs-dir).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from delta import DeltaWriter, FingerprintStore
+from exporter import SINKS, ResultWriter
+from http_cache import MODES as CACHE_MODES, ResponseCache
+from images import MODES as IMAGE_MODES, ImageStage, ImageStore
+from jobs import JobStore, job_id_for
+from parser_pool import ParserPool
+from pipeline import RUN_MODES, read_sheet, record_stats, run_job
+from scraper import MultiScraper
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Scrape a materialId | Source | Product URL sheet.")
+    ap.add_argument('input', type=Path, help="input .csv or .xlsx")
+    ap.add_argument('-o', '--output', type=Path, help="output file (default: results.<format> next to input)")
+    ap.add_argument('--format', choices=list(SINKS), help="xlsx, csv or parquet (default: from --output suffix)")
+    ap.add_argument('--workers', type=int, default=8)
+    ap.add_argument('--per-site', type=int, default=2, help="max parallel requests per site")
+    ap.add_argument('--delay', type=float, default=2.0, help="seconds between requests to the same site")
+    ap.add_argument('--parsers', type=int, default=0,
+                    help="parser worker processes (default 0: parse in the fetch threads)")
+    ap.add_argument('--mode', choices=list(RUN_MODES.values()), default='resume',
+                    help="resume: skip rows already successful; failed: retry failed rows only; fresh: start over")
+    ap.add_argument('--cache', choices=list(CACHE_MODES.values()), default='normal')
+    ap.add_argument('--ttl', type=float, default=24.0, help="cache TTL in hours")
+    ap.add_argument('--jobs-dir', default='.sku_jobs')
+    ap.add_argument('--cache-db', default='.sku_cache/responses.db')
+    ap.add_argument('--delta', action='store_true',
+                    help="only export products new or changed since the last delta run, plus a Change Log")
+    ap.add_argument('--catalogue', help="name the delta fingerprints are kept under (default: input file name)")
+    ap.add_argument('--fingerprints', default='.sku_cache/fingerprints.db')
+    ap.add_argument('--images', choices=list(IMAGE_MODES.values()), default='off',
+                    help="full-size, dedupe and check image links; 'download' also stores them")
+    ap.add_argument('--image-store', default='.sku_images', help="content-addressed image directory")
+    ap.add_argument('--metrics', type=Path, help="also write Prometheus text-format run metrics here")
+    ap.add_argument('-q', '--quiet', action='store_true')
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or (args.output.suffix[1:] if args.output and args.output.suffix[1:] in SINKS else 'xlsx')
+    output = args.output or args.input.with_name(f"results.{fmt}")
+
+    df = read_sheet(args.input, args.input.name)
+    job = JobStore(job_id_for(args.input.read_bytes()), args.jobs_dir)
+    cache = ResponseCache(args.cache_db, ttl=args.ttl * 3600, mode=args.cache)
+    writer = ResultWriter(output, fmt)
+    if args.delta:
+        fingerprints = FingerprintStore(args.fingerprints)
+        writer = DeltaWriter(writer, fingerprints, args.catalogue or args.input.name, df['materialId'])
+    parsers = ParserPool(args.parsers) if args.parsers > 0 else None
+    images = None if args.images == 'off' else ImageStage(
+        store=ImageStore(args.image_store) if args.images == 'download' else None)
+    scraper = MultiScraper(cache, parsers=parsers, images=images)
+
+    done, ok = 0, 0
+    notify = None if args.quiet else (lambda msg: print(msg, file=sys.stderr, flush=True))
+    for done, total, result in run_job(df, job, scraper, writer, args.mode,
+                                       args.workers, args.per_site, args.delay, notify=notify):
+        ok += result.ok
+        if not args.quiet:
+            print(f"[{done}/{total}] {result.status:<7} {result.product_url} {result.error_reason}",
+                  file=sys.stderr, flush=True)
+    record_stats(scraper, writer)
+    path = writer.close()
+    cache.close()
+    if parsers:
+        parsers.close()
+    if images:
+        images.close()
+    if args.delta:
+        fingerprints.close()
+        print("Delta: " + ", ".join(f"{n} {change}" for change, n in writer.changes.items()), file=sys.stderr)
+    if args.metrics:
+        args.metrics.write_text(scraper.stats.to_prometheus())
+
+    print(f"Job {job.job_id}: scraped {done} rows ({ok} success, {done - ok} failed), "
+          f"cache {cache.hits + cache.revalidated} hits / {cache.misses} misses", file=sys.stderr)
+    print(f"{path}: " + ", ".join(f"{name} {n}" for name, n in writer.counts.items()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+HTTP CACHE - persistent response cache with conditional revalidation
+====================================================================
+Bodies are stored zlib-compressed in SQLite, keyed by a hash of the
+normalized URL. Fresh entries are served without touching the network,
+stale ones are revalidated with If-None-Match / If-Modified-Since.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODES = {'Use cache': 'normal', 'Refresh': 'refresh', 'Cache only': 'cache_only', 'Bypass': 'bypass'}
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class CacheMiss(Exception):
+    pass
+
+
+def normalize_url(url):
+    parts = urlsplit(str(url).strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def cache_key(url):
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+def _response(url, status, headers, body):
+    r = requests.Response()
+    r.url = url
+    r.status_code = status
+    r.headers = CaseInsensitiveDict(headers)
+    r.encoding = requests.utils.get_encoding_from_headers(r.headers)
+    r._content = body
+    return r
+
+
+class ResponseCache:
+    def __init__(self, path='.sku_cache/responses.db', ttl=24 * 3600, mode='normal'):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.mode = mode
+        self.hits = self.misses = self.revalidated = 0
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, body BLOB, fetched_at REAL)""")
+        self.db.commit()
+
+    def get(self, session, url, timeout):
+        if self.mode == 'bypass':
+            return session.get(url, timeout=timeout)
+
+        key = cache_key(url)
+        with self.lock:
+            row = self.db.execute("SELECT status, headers, body, fetched_at FROM responses WHERE key = ?",
+                                  (key,)).fetchone()
+        if row:
+            status, headers, body, fetched_at = row
+            headers = json.loads(headers)
+            cached = _response(url, status, headers, zlib.decompress(body))
+            if self.mode == 'cache_only' or (self.mode == 'normal' and time.time() - fetched_at < self.ttl):
+                self._count('hits')
+                return cached
+        elif self.mode == 'cache_only':
+            self._count('misses')
+            raise CacheMiss("not in cache")
+
+        conditional = {}
+        if row and headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if row and headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        r = session.get(url, timeout=timeout, headers=conditional)
+
+        if r.status_code == 304 and row:
+            self._count('revalidated')
+            with self.lock:
+                self.db.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+                self.db.commit()
+            return cached
+
+        self._count('misses')
+        if r.status_code == 200:
+            self.store(key, url, r)
+        return r
+
+    def store(self, key, url, r):
+        headers = {h: r.headers[h] for h in KEPT_HEADERS if h in r.headers}
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                            (key, normalize_url(url), r.status_code, json.dumps(headers),
+                             zlib.compress(r.content), time.time()))
+            self.db.commit()
+
+    def discard(self, url):
+        with self.lock:
+            self.db.execute("DELETE FROM responses WHERE key = ?", (cache_key(url),))
+            self.db.commit()
+
+    def _count(self, name):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,124 @@
+"""
+IMAGE STAGE - full-size rewrite, dedupe, link check and local store
+===================================================================
+Optional pass over a scraped record's images, run by MultiScraper in the
+fetch lane right after extraction so it overlaps with the rest of the
+scrape. Thumbnail URLs are rewritten to the full-size variant with the
+site's 'full_size' rules, duplicates collapse onto one canonical URL, and
+each distinct URL is checked once per run with a HEAD request (GET when
+the CDN refuses HEAD) on a small thread pool sharing the pooled session.
+With a store, images are downloaded into a content-addressed directory
+(<root>/<sha256[:2]>/<sha256>.<ext>) so repeats are stored once.
+"""
+
+import hashlib
+import mimetypes
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+from http_client import shared_session
+from records import Image
+from sites import SITES
+
+MODES = {'Off': 'off', 'Check links': 'check', 'Download': 'download'}
+NO_HEAD = {403, 405, 501}
+
+
+def full_size(url, rules):
+    for pattern, repl in rules:
+        url = pattern.sub(repl, url)
+    return url
+
+
+def canonical(url):
+    parts = urlparse(url)
+    return f"{parts.netloc.lower().removeprefix('www.')}{parts.path}"
+
+
+def dedupe(urls):
+    seen, out = set(), []
+    for url in urls:
+        key = canonical(url)
+        if key not in seen:
+            seen.add(key)
+            out.append(url)
+    return out
+
+
+class ImageStore:
+    """Content-addressed image files under `root`."""
+
+    def __init__(self, root='.sku_images'):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def save(self, response):
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.root)
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in response.iter_content(64 * 1024):
+                digest.update(chunk)
+                f.write(chunk)
+        sha = digest.hexdigest()
+        ext = (mimetypes.guess_extension(response.headers.get('Content-Type', '').split(';')[0].strip())
+               or Path(urlparse(response.url).path).suffix or '.img')
+        path = self.root / sha[:2] / f"{sha}{ext}"
+        path.parent.mkdir(exist_ok=True)
+        if path.exists():
+            os.remove(tmp)
+        else:
+            os.replace(tmp, path)
+        return str(path)
+
+
+class ImageStage:
+    def __init__(self, session=None, store=None, workers=8, timeout=10):
+        self.session = session or shared_session()
+        self.store = store
+        self.timeout = timeout
+        self.pool = ThreadPoolExecutor(workers)
+        self.seen = {}
+        self.lock = threading.Lock()
+
+    def process(self, key, record):
+        """Replace record.images: full-size, deduped, each with a status (and local path)."""
+        if not record.images:
+            return record
+        rules = SITES[key]['images'].get('full_size', [])
+        urls = dedupe([full_size(img.url, rules) for img in record.images])
+        checked = self.pool.map(self.check, urls)
+        record.images = [Image(url, status, path) for url, (status, path) in zip(urls, checked)]
+        return record
+
+    def check(self, url):
+        """(status, local path) for one image URL; each URL is fetched at most once per stage."""
+        with self.lock:
+            if url in self.seen:
+                return self.seen[url]
+        try:
+            status, path = self._fetch(url)
+        except Exception as e:
+            status, path = f"error: {str(e)[:50]}", ''
+        with self.lock:
+            self.seen[url] = (status, path)
+        return status, path
+
+    def _fetch(self, url):
+        r = None
+        if not self.store:
+            r = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+        if r is None or r.status_code in NO_HEAD:
+            r = self.session.get(url, timeout=self.timeout, stream=True)
+        with r:
+            if r.status_code != 200:
+                return f"HTTP {r.status_code}", ''
+            if not r.headers.get('Content-Type', 'image/').startswith('image/'):
+                return 'not an image', ''
+            return 'ok', self.store.save(r) if self.store else ''
+
+    def close(self):
+        self.pool.shutdown()
@@ -0,0 +1,91 @@
+"""
+JOBS - append-only checkpoint of bulk results
+=============================================
+Every scraped row is appended to .sku_jobs/<job_id>.jsonl as soon as it
+finishes, keyed by materialId + URL. A job id is derived from the uploaded
+file's bytes, so re-uploading the same sheet after a refresh or crash picks
+the job back up. The latest record for a key wins. Lines hold
+records.Record.to_dict() output.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+
+def job_id_for(data):
+    return hashlib.sha1(data).hexdigest()[:12]
+
+
+def row_key(mid, url):
+    return f"{mid}|{url}"
+
+
+def _plain(value):
+    # numpy scalars from pandas rows, timestamps, NaN-filled cells
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class JobStore:
+    def __init__(self, job_id, root='.sku_jobs'):
+        self.job_id = job_id
+        self.path = Path(root) / f"{job_id}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def records(self):
+        if not self.path.exists():
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-write
+                    continue
+
+    def latest(self):
+        """Stream the latest record per key without holding the whole job in memory."""
+        last = {}
+        for n, rec in enumerate(self.records()):
+            last[rec['key']] = n
+        for n, rec in enumerate(self.records()):
+            if last[rec['key']] == n:
+                yield rec
+
+    def offsets(self):
+        """Byte offset of the latest line per key - an index, not the records themselves."""
+        last, pos = {}, 0
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    try:
+                        last[json.loads(line)['key']] = pos
+                    except json.JSONDecodeError:
+                        pass
+                    pos += len(line)
+        return last
+
+    def read_at(self, offsets):
+        """The records at the given byte offsets, one at a time, in the order given."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    def statuses(self):
+        return {rec['key']: rec['main']['status'] for rec in self.latest()}
+
+    def export_path(self, fmt):
+        return self.path.with_name(f"{self.job_id}.results.{fmt}")
+
+    def append(self, mid, url, record):
+        rec = {'key': row_key(mid, url), **record.to_dict()}
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(rec, default=_plain, ensure_ascii=False) + '\n')
+
+    def reset(self):
+        self.path.unlink(missing_ok=True)
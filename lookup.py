@@ -0,0 +1,83 @@
+"""
+LOOKUP - quick multi-URL lookups for single mode
+================================================
+Pasted URLs are deduplicated by canonical product, fetched concurrently
+through run_bulk (same per-site politeness as bulk runs) and yielded as
+each finishes. Successful records are kept in an in-process LRU with a
+TTL, so re-checking a recently seen product needs no request at all.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from bulk_runner import run_bulk
+from sites import canonical_key
+
+
+class ResultCache:
+    """Recent successful records keyed by canonical product; oldest evicted past `maxsize`."""
+
+    def __init__(self, maxsize=500, ttl=900):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item and time.monotonic() - item[0] < self.ttl:
+                self.items.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item:
+                del self.items[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, record):
+        with self.lock:
+            self.items[key] = (time.monotonic(), record)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def evict(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+
+def lookup(scraper, urls, source, cache=None, workers=8, per_domain=2, delay=1.0):
+    """Yield (position, record, cached) per URL as results arrive; cache hits come first.
+
+    Records are labelled with materialId = position + 1.
+    """
+    groups = {}
+    for i, url in enumerate(urls):
+        groups.setdefault(canonical_key(url), []).append(i)
+
+    rows = []
+    for key, members in groups.items():
+        record = cache.get(key) if cache is not None else None
+        if record:
+            for i in members:
+                yield i, record.relabel(i + 1, source, urls[i]), True
+        else:
+            rows.append((members[0], members[0] + 1, source, urls[members[0]]))
+
+    for idx, record in run_bulk(scraper, rows, workers, per_domain, delay):
+        key = canonical_key(urls[idx])
+        if cache is not None and record.ok:
+            cache.put(key, record)
+        for i in groups[key]:
+            yield i, record if i == idx else record.relabel(i + 1, source, urls[i]), False
@@ -0,0 +1,57 @@
+"""
+PARSER POOL - page parsing in worker processes
+==============================================
+lxml and soup traversal hold the GIL, so however many fetch lanes run,
+parsing is capped at one core. ParserPool runs sites.extract in a process
+pool: fetch lanes stay threads, submit the raw bytes and go on to their
+next row; workers decode the page and send back the finished record.
+At most `backlog` pages are in flight - past that, submit() blocks the
+lane (backpressure) instead of piling up HTML in memory.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sites import extract
+
+
+def _decode(content, encoding):
+    # Same as requests' Response.text
+    try:
+        return str(content, encoding or 'utf-8', errors='replace')
+    except (LookupError, TypeError):
+        return str(content, errors='replace')
+
+
+def _extract(key, mid, src, url, content, encoding):
+    timings = {}
+    record = extract(key, mid, src, url, content, _decode(content, encoding), timings)
+    # perf_counter is a system-wide monotonic clock, comparable with the parent's
+    timings['done'] = time.perf_counter()
+    return record, timings
+
+
+class ParserPool:
+    def __init__(self, processes=None, backlog=None):
+        self.processes = processes or os.cpu_count() or 1
+        # spawn, not fork: the parent is a threaded app (Streamlit, fetch lanes)
+        self.pool = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn'))
+        self.slots = threading.BoundedSemaphore(backlog or self.processes * 2)
+
+    def submit(self, key, mid, src, url, content, encoding):
+        """Future of (record, timings) from sites.extract in a worker, timings['done'] being when it
+        finished; blocks while the backlog is full."""
+        self.slots.acquire()
+        try:
+            future = self.pool.submit(_extract, key, mid, src, url, content, encoding)
+        except Exception:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda f: self.slots.release())
+        return future
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,33 @@
+"""
+PARSING - lxml-backed soups restricted to the regions each site needs
+=====================================================================
+Only tags matching a site's strainer (sites.SITES 'parse_only') and
+everything inside them are built into the tree, so the rest of a
+multi-megabyte page is skipped.
+"""
+
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+class AnyStrainer(SoupStrainer):
+    """Keep a tag if any of the given strainers would keep it."""
+
+    def __init__(self, *strainers):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+    def allow_string_creation(self, string):
+        return False
+
+
+def has_class(name):
+    # Raw class attribute is still a single string while parsing
+    return re.compile(rf'(?:^|\s){re.escape(name)}(?:\s|$)')
+
+
+def make_soup(content, parse_only=None):
+    return BeautifulSoup(content, 'lxml', parse_only=parse_only)
@@ -0,0 +1,134 @@
+"""
+BULK PIPELINE - sheet in, checkpointed and exported results out
+===============================================================
+Shared by the Streamlit bulk view and the harvest.py CLI.
+"""
+
+import time
+from collections import Counter
+
+import pandas as pd
+
+from bulk_runner import run_bulk
+from jobs import row_key
+from records import Record
+from retry import REQUEUE
+from sites import canonical_key, site_for
+from stats import STATS_COLUMNS, estimate_seconds
+
+REQUIRED = ['materialId', 'Source', 'Product URL']
+RUN_MODES = {'Resume': 'resume', 'Retry failed only': 'failed', 'Start over': 'fresh'}
+
+
+def read_sheet(f, name):
+    df = pd.read_csv(f) if str(name).endswith('.csv') else pd.read_excel(f)
+    missing = [c for c in REQUIRED if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return df
+
+
+def sheet_keys(df):
+    return [row_key(m, u) for m, u in zip(df['materialId'], df['Product URL'])]
+
+
+def pending_rows(keys, statuses, mode):
+    """Row positions to scrape for a run mode ('resume', 'failed' or 'fresh')."""
+    if mode == 'resume':
+        return [i for i, k in enumerate(keys) if statuses.get(k) != 'Success']
+    if mode == 'failed':
+        return [i for i, k in enumerate(keys) if statuses.get(k) == 'Failed']
+    return list(range(len(keys)))
+
+
+def estimate(df, pending, delay):
+    """Seconds to fetch the given rows, from observed per-site throughput where known."""
+    counts = Counter(site_for(u) for u in df['Product URL'].iloc[pending])
+    counts.pop(None, None)
+    return estimate_seconds(counts, delay)
+
+
+def export_saved(job, keys, writer):
+    """Write the job's checkpointed rows for this sheet, in sheet order.
+
+    Only a key -> file offset index is kept; records are read back one at a time.
+    """
+    offsets = job.offsets()
+    for rec in job.read_at(offsets[k] for k in keys if k in offsets):
+        writer.write(Record.from_dict(rec))
+
+
+def coalesce(df, pending):
+    """Group pending row positions by canonical product, first row of each group first."""
+    groups = {}
+    for i, url in zip(pending, df['Product URL'].iloc[pending]):
+        groups.setdefault(canonical_key(url), []).append(i)
+    return groups
+
+
+def run_job(df, job, scraper, writer, mode='resume', workers=8, per_domain=2, delay=2.0, requeue=True,
+            notify=None):
+    """Scrape the sheet's pending rows, checkpointing and exporting each one.
+
+    Rows pointing at the same product are fetched once and the result is
+    fanned out to every materialId. CAPTCHA'd and throttled products are
+    held back and retried in one slower pass at the end, once paused sites
+    have cooled down.
+    Progress is yielded as (done, total, result) per row as they finish.
+    Results only go to the checkpoint while scraping; once every row is
+    done the export is written from it in sheet order (saved and new rows
+    alike), so no finished record waits in memory for a slower one ahead
+    of it. The caller closes the writer.
+    """
+    if mode == 'fresh':
+        job.reset()
+    keys = sheet_keys(df)
+    statuses = job.statuses()
+    pending = pending_rows(keys, statuses, mode)
+
+    records = df.to_dict('records')
+    members = {g[0]: g for g in coalesce(df, pending).values()}
+    rows = [(i, records[i]['materialId'], records[i]['Source'], records[i]['Product URL']) for i in members]
+
+    def fan_out(idx, result):
+        outs = []
+        for i in members[idx]:
+            rec = records[i]
+            out = result if i == idx else result.relabel(rec['materialId'], rec['Source'], rec['Product URL'])
+            # The checkpoint is what gets exported, and a rerun or crash never loses a finished row
+            job.append(rec['materialId'], rec['Product URL'], out)
+            outs.append(out)
+        return outs
+
+    done, deferred = 0, {}
+    for idx, result in run_bulk(scraper, rows, workers, per_domain, delay):
+        outs = fan_out(idx, result)
+        if requeue and result.error_category in REQUEUE:
+            deferred[idx] = result.retries
+            continue
+        for out in outs:
+            done += 1
+            yield done, len(pending), out
+
+    if deferred:
+        yield from _requeue(scraper, rows, deferred, fan_out, done, len(pending), workers, delay, notify)
+    export_saved(job, keys, writer)
+
+
+def _requeue(scraper, rows, deferred, fan_out, done, total, workers, delay, notify):
+    wait = max((b.remaining() for b in scraper.breakers.values()), default=0)
+    if notify:
+        notify(f"Requeueing {len(deferred)} throttled products" + (f" after a {wait:.0f}s cool-down" if wait else ""))
+    time.sleep(wait)
+    again = [row for row in rows if row[0] in deferred]
+    for idx, result in run_bulk(scraper, again, workers, 1, delay * 2):
+        result.retries += deferred[idx] + 1
+        for out in fan_out(idx, result):
+            done += 1
+            yield done, total, out
+
+
+def record_stats(scraper, writer):
+    """Add the Run Stats sheet and remember this run's throughput for the next estimate."""
+    writer.write_table('Run Stats', STATS_COLUMNS, scraper.stats.summary())
+    scraper.stats.save_throughput()
@@ -0,0 +1,125 @@
+"""
+RECORDS - compact in-memory result model
+========================================
+One Record per scraped row. Scalars live in __slots__, price/MRP/GST are
+numbers (None when not found), specifications are (name, value) tuples
+and images are Image slots. materialId and product_name are held once on
+the record and only expanded into per-sheet row dicts at export time.
+
+Checkpoints store to_dict() output; from_dict() also reads the older
+{'main', 'specifications', 'images'} layout with formatted prices.
+"""
+
+import re
+from dataclasses import dataclass, field, fields, replace
+
+NUMBER = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+
+def amount(value):
+    """'₹1,29,999' -> 129999, '18%' -> 18, '12.50' -> 12.5; None when there is no number."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    m = NUMBER.search(str(value))
+    if not m:
+        return None
+    number = float(m.group().replace(',', ''))
+    return int(number) if number.is_integer() else number
+
+
+def format_price(value, currency='INR'):
+    """Display form: ₹ with Indian digit grouping (₹1,29,999), or '<currency> <amount>'."""
+    if value is None:
+        return 'N/A'
+    if currency != 'INR':
+        return f"{currency} {value}"
+    whole, _, paise = f"{value:.2f}".partition('.')
+    head, tail = whole[:-3], whole[-3:]
+    groups = []
+    while len(head) > 2:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    text = ','.join(([head] if head else []) + groups + [tail])
+    return f"₹{text}" + (f".{paise}" if paise != '00' else '')
+
+
+@dataclass(slots=True)
+class Image:
+    url: str
+    status: str = ''
+    path: str = ''
+
+
+@dataclass(slots=True)
+class Record:
+    materialId: object
+    source: object
+    product_url: str
+    status: str
+    product_name: str = 'N/A'
+    price: object = None
+    gst: object = None
+    mrp: object = None
+    currency: str = 'INR'
+    brand: str = 'N/A'
+    sku: str = 'N/A'
+    seller_name: str = 'N/A'
+    error_reason: str = ''
+    retries: int = 0
+    error_category: str = ''
+    extraction_path: str = ''
+    scraped_at: str = ''
+    specs: list = field(default_factory=list)
+    images: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return self.status == 'Success'
+
+    @property
+    def main_image_url(self):
+        good = [img.url for img in self.images if img.status in ('', 'ok')]
+        return good[0] if good else self.images[0].url if self.images else 'N/A'
+
+    def relabel(self, mid, src, url):
+        """Same product for another sheet row; specs and images are shared, not copied."""
+        return replace(self, materialId=mid, source=src, product_url=url)
+
+    # Export rows, built on demand
+    def main_rows(self):
+        return [{'materialId': self.materialId, 'source': self.source, 'product_url': self.product_url,
+                 'product_name': self.product_name, 'base_price': self.price, 'gst': self.gst,
+                 'final_price': self.price, 'mrp': self.mrp, 'currency': self.currency, 'brand': self.brand,
+                 'sku': self.sku, 'seller_name': self.seller_name, 'main_image_url': self.main_image_url,
+                 'additional_images_count': max(len(self.images) - 1, 0), 'status': self.status,
+                 'error_reason': self.error_reason, 'retries': self.retries, 'error_category': self.error_category,
+                 'extraction_path': self.extraction_path, 'scraped_at': self.scraped_at}]
+
+    def spec_rows(self):
+        return [{'materialId': self.materialId, 'product_name': self.product_name,
+                 'specification_name': k, 'specification_value': v} for k, v in self.specs]
+
+    def image_rows(self):
+        return [{'materialId': self.materialId, 'product_name': self.product_name, 'image_url': img.url,
+                 'image_type': 'main' if i == 0 else 'thumbnail', 'image_order': i + 1,
+                 'image_status': img.status, 'local_path': img.path} for i, img in enumerate(self.images)]
+
+    def to_dict(self):
+        return {'main': {f.name: getattr(self, f.name) for f in fields(self) if f.name not in ('specs', 'images')},
+                'specs': [list(s) for s in self.specs],
+                'images': [[img.url, img.status, img.path] for img in self.images]}
+
+    @classmethod
+    def from_dict(cls, data):
+        main = data['main']
+        kw = {f.name: main[f.name] for f in fields(cls) if f.name in main}
+        if 'specifications' in data:
+            # Checkpoint written before Record: formatted prices, one dict per spec/image row
+            kw.update(price=amount(main.get('final_price')), gst=amount(main.get('gst')), mrp=amount(main.get('mrp')))
+            kw['specs'] = [(s['specification_name'], s['specification_value']) for s in data['specifications']]
+            kw['images'] = [Image(img['image_url'], img.get('image_status') or '', img.get('local_path') or '')
+                            for img in data['images']]
+        else:
+            kw['specs'] = [tuple(s) for s in data['specs']]
+            kw['images'] = [Image(*img) for img in data['images']]
+        return cls(**kw)
@@ -0,0 +1,91 @@
+"""
+RETRY - backoff policy and per-site circuit breaker
+===================================================
+Transient failures (timeouts, connection errors, 429/5xx) are retried
+with exponential backoff and full jitter, honouring Retry-After. A site
+whose recent responses are mostly CAPTCHAs is paused for a cool-down so
+its remaining rows can be requeued instead of burning more blocks.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import requests
+
+# Final error categories reported in Main Results
+RETRYABLE = {'timeout', 'connection', 'throttled', 'server_error'}
+REQUEUE = {'captcha', 'circuit_open', 'throttled'}
+
+
+def classify(exc):
+    if isinstance(exc, requests.Timeout):
+        return 'timeout'
+    if isinstance(exc, requests.ConnectionError):
+        return 'connection'
+    return 'error'
+
+
+def retry_after(headers):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(self, attempts=3, base=1.0, cap=60.0):
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+
+    def delay(self, retry, hint=None):
+        if hint is not None:
+            return min(self.cap, hint)
+        return random.uniform(0, min(self.cap, self.base * 2 ** retry))
+
+
+class CircuitBreaker:
+    """Opens when at least `threshold` of the last `window` responses were CAPTCHAs."""
+
+    def __init__(self, window=20, threshold=0.3, min_samples=5, cooldown=120.0):
+        self.window = deque(maxlen=window)
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # Half-open: start over with a clean window
+                self.opened_at = None
+                self.window.clear()
+                return True
+            return False
+
+    def record(self, captcha):
+        with self.lock:
+            self.window.append(bool(captcha))
+            if (len(self.window) >= self.min_samples
+                    and sum(self.window) / len(self.window) >= self.threshold):
+                self.opened_at = time.monotonic()
+
+    def remaining(self):
+        with self.lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
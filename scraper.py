@@ -0,0 +1,130 @@
+"""
+SCRAPER ENGINE - fetch + dispatch, importable without Streamlit
+===============================================================
+MultiScraper fetches a product URL over the shared pooled session
+(optionally through the response cache), retries transient failures,
+and hands the page to the site entry registered for its host - in a
+ParserPool worker process when one is given, else in the calling thread.
+An ImageStage, when given, post-processes each successful record's images.
+
+scrape() does it all in one call. Bulk lanes use start()/finish()
+instead, so a fetch thread can move on to its next row while the
+previous page is still being parsed.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+from bulk_runner import domain_of
+from http_client import shared_session
+from retry import RETRYABLE, RetryPolicy, CircuitBreaker, classify, retry_after
+from stats import RunStats
+from sites import SITES, site_for, fetch_url, blocked, extract, error_record
+
+# A page handed to the ParserPool; finish() turns it into a Record
+Parsing = namedtuple('Parsing', 'future key mid source url timings nbytes retries started')
+
+
+class MultiScraper:
+    def __init__(self, cache=None, retry=None, session=None, parsers=None, images=None):
+        self.cache = cache
+        self.parsers = parsers
+        self.images = images
+        self.retry = retry or RetryPolicy()
+        self.stats = RunStats()
+        self.breakers = {}
+        self.lock = threading.Lock()
+        self.session = session or shared_session()
+    
+    def _get(self, url, timeout):
+        if self.cache:
+            return self.cache.get(self.session, url, timeout)
+        return self.session.get(url, timeout=timeout)
+    
+    def scrape(self, mid, source, url, acquire=None):
+        """`acquire()`, when given, is called before every attempt (retries included) to pace requests."""
+        return self.finish(self.start(mid, source, url, acquire))
+    
+    def start(self, mid, source, url, acquire=None):
+        """Fetch with retries. Returns the Record, or a Parsing still in a worker process."""
+        key = site_for(url)
+        if not key:
+            return self._error(mid, source, url, "Website not supported", 'unsupported')
+        label = SITES[key]['label']
+        breaker = self.breaker(domain_of(url))
+        if not breaker.allow():
+            return self._error(mid, source, url, f"{label}: paused after repeated CAPTCHAs", 'circuit_open')
+        
+        retries, started = 0, time.perf_counter()
+        while True:
+            hint, timings, nbytes = None, {}, 0
+            if acquire:
+                acquire()
+            try:
+                t = time.perf_counter()
+                r = self._get(fetch_url(key, url), SITES[key]['timeout'])
+                fetched = time.perf_counter() - t
+                # elapsed stops when headers arrive; cached responses have none
+                timings['ttfb'] = min(fetched, r.elapsed.total_seconds())
+                timings['download'] = fetched - timings['ttfb']
+                nbytes = len(r.content)
+                reason = blocked(key, r.status_code, r.content)
+                breaker.record(reason)
+                if reason:
+                    if self.cache:
+                        self.cache.discard(fetch_url(key, url))
+                    result = self._error(mid, source, url, reason, 'captcha')
+                elif r.status_code == 429 or r.status_code >= 500:
+                    hint = retry_after(r.headers)
+                    result = self._error(mid, source, url, f"{label}: HTTP {r.status_code}",
+                                         'throttled' if r.status_code == 429 else 'server_error')
+                elif self.parsers:
+                    # Only the bytes cross to the worker, which decodes them itself
+                    future = self.parsers.submit(key, mid, source, url, r.content, r.encoding or r.apparent_encoding)
+                    return Parsing(future, key, mid, source, url, timings, nbytes, retries, started)
+                else:
+                    result = extract(key, mid, source, url, r.content, r.text, timings)
+            except Exception as e:
+                result = self._error(mid, source, url, f"{label}: {str(e)[:50]}", classify(e))
+            
+            if result.error_category not in RETRYABLE or retries >= self.retry.attempts:
+                return self._done(key, result, timings, nbytes, retries, started)
+            time.sleep(self.retry.delay(retries, hint))
+            retries += 1
+    
+    def ready(self, handle):
+        """True when finish(handle) will not wait for a parser."""
+        return not isinstance(handle, Parsing) or handle.future.done()
+    
+    def finish(self, handle):
+        """The Record for what start() returned, waiting for its parse if need be."""
+        if not isinstance(handle, Parsing):
+            return handle
+        try:
+            result, spent = handle.future.result()
+            # Parse end as stamped by the worker, so time spent waiting in the lane is not counted
+            ended = spent.pop('done')
+            handle.timings.update(spent)
+        except Exception as e:
+            label = SITES[handle.key]['label']
+            result = self._error(handle.mid, handle.source, handle.url, f"{label}: {str(e)[:50]}", classify(e))
+            ended = None
+        return self._done(handle.key, result, handle.timings, handle.nbytes, handle.retries, handle.started, ended)
+    
+    def _done(self, key, result, timings, nbytes, retries, started, ended=None):
+        result.retries = retries
+        if self.images and result.ok:
+            self.images.process(key, result)
+        timings['total'] = (ended or time.perf_counter()) - started
+        self.stats.record(key, timings, nbytes, result.ok, result.extraction_path)
+        return result
+    
+    def breaker(self, domain):
+        with self.lock:
+            if domain not in self.breakers:
+                self.breakers[domain] = CircuitBreaker()
+            return self.breakers[domain]
+    
+    def _error(self, mid, src, url, reason, category='error'):
+        return error_record(mid, src, url, reason, category)
@@ -5,14 +5,45 @@ Beautiful MOOFIE UI (locked design)
 Working scrapers: Industry Buying, Moglix, Amazon
 """
 
+import os
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import time
-import requests
-from bs4 import BeautifulSoup
-import re
-from io import BytesIO
+from scraper import MultiScraper
+from http_client import make_session
+from parser_pool import ParserPool
+from http_cache import ResponseCache, MODES as CACHE_MODES
+from images import MODES as IMAGE_MODES, ImageStage, ImageStore
+from jobs import JobStore, job_id_for
+from lookup import ResultCache, lookup
+from records import format_price
+from sites import canonical_key
+from exporter import ResultWriter, SHEETS, FORMATS
+from delta import DeltaWriter, FingerprintStore
+from pipeline import (read_sheet, sheet_keys, pending_rows, coalesce, estimate, export_saved, run_job, record_stats,
+                      RUN_MODES)
+
+
+@st.cache_resource
+def http_session():
+    # Survives reruns, so keep-alive connections are reused across button clicks
+    return make_session()
+
+
+@st.cache_resource
+def lookup_cache():
+    # Recent single-mode results, shared by every session of this server
+    return ResultCache()
+
+
+@st.cache_resource
+def parser_pool(processes):
+    # Worker processes outlive reruns; spawning them costs a second or two
+    return ParserPool(processes)
+
+
+LIVE_STATS = ['site', 'rows', 'failed', 'rows_per_min', 'mb', 'ttfb_p50', 'ttfb_p95', 'download_p50',
+              'parse_p50', 'extract_p50', 'total_p95', 'structured_pct', 'hybrid_pct', 'html_pct']
 
 st.set_page_config(page_title="SKU Harvester - Moofie", page_icon="⚙", layout="wide", initial_sidebar_state="expanded")
 
@@ -67,202 +98,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# SCRAPER ENGINE
-class MultiScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-        })
-    
-    def scrape(self, mid, source, url):
-        try:
-            if 'industry' in source.lower():
-                return self._industrybuying(mid, source, url)
-            elif 'moglix' in source.lower():
-                return self._moglix(mid, source, url)
-            elif 'amazon' in source.lower():
-                return self._amazon(mid, source, url)
-            else:
-                return self._error(mid, source, url, "Website not supported")
-        except Exception as e:
-            return self._error(mid, source, url, str(e))
-    
-    def _industrybuying(self, mid, src, url):
-        try:
-            r = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(r.content, 'html.parser')
-            
-            name = soup.select_one('h1')
-            if not name:
-                return self._error(mid, src, url, "Product not found")
-            name = name.get_text().strip()
-            
-            price, gst, mrp = 'N/A', 'N/A', 'N/A'
-            pm = re.search(r'₹\s*([\d,]+)', r.text)
-            if pm:
-                price = f"₹{pm.group(1)}"
-            gm = re.search(r'(\d+)%\s*GST', r.text)
-            if gm:
-                gst = f"{gm.group(1)}%"
-            
-            mrp_e = soup.select_one('.mrp')
-            if mrp_e:
-                mm = re.search(r'₹\s*([\d,]+)', mrp_e.get_text())
-                if mm:
-                    mrp = f"₹{mm.group(1)}"
-            
-            sku = re.search(r'/([A-Z.0-9]+)/?$', url)
-            sku = sku.group(1) if sku else 'N/A'
-            
-            images = []
-            for img in soup.select('img')[:5]:
-                src_img = img.get('src', '')
-                if 'product' in src_img.lower() or 'image' in src_img.lower():
-                    if not src_img.startswith('http'):
-                        src_img = 'https://www.industrybuying.com' + src_img
-                    images.append({'materialId': mid, 'product_name': name, 'image_url': src_img,
-                                  'image_type': 'main' if len(images) == 0 else 'thumbnail',
-                                  'image_order': len(images) + 1})
-            
-            specs = []
-            for table in soup.select('table'):
-                for row in table.select('tr'):
-                    cells = row.select('td, th')
-                    if len(cells) >= 2:
-                        k, v = cells[0].get_text().strip(), cells[1].get_text().strip()
-                        if k and v and len(k) < 100:
-                            specs.append({'materialId': mid, 'product_name': name,
-                                        'specification_name': k, 'specification_value': v})
-            
-            return {'main': {'materialId': mid, 'source': src, 'product_url': url, 'product_name': name,
-                            'base_price': price, 'gst': gst, 'final_price': price, 'mrp': mrp,
-                            'brand': 'N/A', 'sku': sku, 'seller_name': 'Industry Buying',
-                            'main_image_url': images[0]['image_url'] if images else 'N/A',
-                            'additional_images_count': len(images) - 1 if images else 0,
-                            'status': 'Success', 'error_reason': '',
-                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
-                   'specifications': specs, 'images': images}
-        except Exception as e:
-            return self._error(mid, src, url, f"IB: {str(e)[:50]}")
-    
-    def _moglix(self, mid, src, url):
-        try:
-            r = self.session.get(url, timeout=15)
-            soup = BeautifulSoup(r.content, 'html.parser')
-            
-            name = soup.select_one('h1')
-            if not name:
-                return self._error(mid, src, url, "Product not found")
-            name = name.get_text().strip()
-            
-            price = 'N/A'
-            pm = re.search(r'₹\s*([\d,]+)', r.text)
-            if pm:
-                price = f"₹{pm.group(1)}"
-            
-            sku = re.search(r'/mp/([a-z0-9]+)', url)
-            sku = sku.group(1) if sku else 'N/A'
-            
-            images = []
-            for img in soup.select('img')[:5]:
-                src_img = img.get('src', '')
-                if 'product' in src_img.lower() or 'moglix' in src_img.lower():
-                    if src_img and len(src_img) > 10:
-                        images.append({'materialId': mid, 'product_name': name, 'image_url': src_img,
-                                      'image_type': 'main' if len(images) == 0 else 'thumbnail',
-                                      'image_order': len(images) + 1})
-            
-            specs = []
-            for table in soup.select('table'):
-                for row in table.select('tr'):
-                    cells = row.select('td, th')
-                    if len(cells) >= 2:
-                        k, v = cells[0].get_text().strip(), cells[1].get_text().strip()
-                        if k and v and len(k) < 100:
-                            specs.append({'materialId': mid, 'product_name': name,
-                                        'specification_name': k, 'specification_value': v})
-            
-            return {'main': {'materialId': mid, 'source': src, 'product_url': url, 'product_name': name,
-                            'base_price': price, 'gst': 'N/A', 'final_price': price, 'mrp': 'N/A',
-                            'brand': 'N/A', 'sku': sku, 'seller_name': 'Moglix',
-                            'main_image_url': images[0]['image_url'] if images else 'N/A',
-                            'additional_images_count': len(images) - 1 if images else 0,
-                            'status': 'Success', 'error_reason': '',
-                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
-                   'specifications': specs, 'images': images}
-        except Exception as e:
-            return self._error(mid, src, url, f"Moglix: {str(e)[:50]}")
-    
-    def _amazon(self, mid, src, url):
-        try:
-            clean_url = re.sub(r'\?.*', '', url)
-            r = self.session.get(clean_url, timeout=20)
-            
-            if 'Robot Check' in r.text or r.status_code == 503:
-                return self._error(mid, src, url, "Amazon CAPTCHA - retry later")
-            
-            soup = BeautifulSoup(r.content, 'html.parser')
-            name = soup.select_one('#productTitle')
-            if not name:
-                return self._error(mid, src, url, "Product not found")
-            name = name.get_text().strip()
-            
-            price = 'N/A'
-            for sel in ['.a-price-whole', '.a-price .a-offscreen']:
-                e = soup.select_one(sel)
-                if e:
-                    pm = re.search(r'₹\s*[\d,]+', e.get_text())
-                    if pm:
-                        price = pm.group().replace(' ', '')
-                        break
-            
-            sku = re.search(r'/dp/([A-Z0-9]{10})', url)
-            sku = sku.group(1) if sku else 'N/A'
-            
-            brand = soup.select_one('#bylineInfo')
-            brand = brand.get_text().strip().replace('Visit the', '').replace('Store', '').strip() if brand else 'N/A'
-            
-            images = []
-            for img in soup.select('#altImages img')[:5]:
-                src_img = img.get('src', '')
-                if 'http' in src_img and 'sprite' not in src_img:
-                    images.append({'materialId': mid, 'product_name': name, 'image_url': src_img,
-                                  'image_type': 'main' if len(images) == 0 else 'thumbnail',
-                                  'image_order': len(images) + 1})
-            
-            specs = []
-            for section in soup.select('#productDetails_techSpec_section_1 tr'):
-                cells = section.select('th, td')
-                if len(cells) >= 2:
-                    specs.append({'materialId': mid, 'product_name': name,
-                                'specification_name': cells[0].get_text().strip(),
-                                'specification_value': cells[1].get_text().strip()})
-            
-            return {'main': {'materialId': mid, 'source': src, 'product_url': url, 'product_name': name,
-                            'base_price': price, 'gst': 'N/A', 'final_price': price, 'mrp': 'N/A',
-                            'brand': brand, 'sku': sku, 'seller_name': 'Amazon',
-                            'main_image_url': images[0]['image_url'] if images else 'N/A',
-                            'additional_images_count': len(images) - 1 if images else 0,
-                            'status': 'Success', 'error_reason': '',
-                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
-                   'specifications': specs, 'images': images}
-        except Exception as e:
-            return self._error(mid, src, url, f"Amazon: {str(e)[:50]}")
-    
-    def _error(self, mid, src, url, reason):
-        return {'main': {'materialId': mid, 'source': src, 'product_url': url, 'product_name': 'N/A',
-                        'base_price': 'N/A', 'gst': 'N/A', 'final_price': 'N/A', 'mrp': 'N/A',
-                        'brand': 'N/A', 'sku': 'N/A', 'seller_name': 'N/A',
-                        'main_image_url': 'N/A', 'additional_images_count': 0,
-                        'status': 'Failed', 'error_reason': reason,
-                        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
-               'specifications': [], 'images': []}
-
 # SESSION STATE
-for k, v in [('total', 0), ('failed', 0), ('mode', 'single'), ('history', [])]:
+for k, v in [('total', 0), ('failed', 0), ('cache_hits', 0), ('cache_misses', 0),
+             ('mode', 'single'), ('history', [])]:
     if k not in st.session_state:
         st.session_state[k] = v
 
@@ -276,6 +114,9 @@ with st.sidebar:
     c1, c2 = st.columns(2)
     c1.metric("Total", st.session_state.total)
     c2.metric("Failed", st.session_state.failed)
+    c1, c2 = st.columns(2)
+    c1.metric("Cache Hits", st.session_state.cache_hits)
+    c2.metric("Cache Misses", st.session_state.cache_misses)
     st.markdown("---")
     
     st.markdown("**📜 RECENT HISTORY**")
@@ -322,7 +163,8 @@ if st.session_state.mode == 'single':
     st.markdown("### 📝 Single Product Extraction")
     
     website = st.selectbox("Website Source", ["Amazon India", "Industry Buying", "Moglix"])
-    url = st.text_input("Product URL", placeholder="https://...")
+    urls = st.text_area("Product URLs (one per line)", placeholder="https://...")
+    urls = [u.strip() for u in urls.splitlines() if u.strip()]
     
     col1, col2 = st.columns(2)
     with col1:
@@ -330,36 +172,49 @@ if st.session_state.mode == 'single':
     with col2:
         email_to = st.text_input("Email To (Optional)", placeholder="recipient@email.com")
     
+    recent = lookup_cache()
+    d1, d2 = st.columns([3, 1])
+    refresh = d1.checkbox(f"🔄 Refresh: ignore recently checked results ({len(recent)} cached)")
+    if d2.button("🗑 Clear cache", use_container_width=True):
+        recent.clear()
+    
     if st.button("🚀 START EXTRACTION", use_container_width=True, type="primary"):
-        if not url:
+        if not urls:
             st.error("⚠️ Please enter URL")
         else:
-            with st.spinner("Extracting..."):
-                scraper = MultiScraper()
-                result = scraper.scrape(1, website, url)
-            
-            if result['main']['status'] == 'Success':
-                st.session_state.total += 1
-                st.session_state.history.append({
-                    'name': result['main']['product_name'][:30],
-                    'count': '1 product',
-                    'time': datetime.now().strftime('%H:%M')
-                })
-                
-                st.markdown('<div class="success-box">✅ Success!</div>', unsafe_allow_html=True)
-                st.write(f"**Product:** {result['main']['product_name']}")
-                st.write(f"**Price:** {result['main']['final_price']}")
-                st.write(f"**Brand:** {result['main']['brand']}")
-                
-                if result['specifications']:
-                    st.markdown("**Specifications:**")
-                    spec_df = pd.DataFrame(result['specifications'])
-                    st.dataframe(spec_df[['specification_name', 'specification_value']], 
-                                use_container_width=True, hide_index=True)
-            else:
-                st.session_state.failed += 1
-                st.markdown(f'<div class="error-box">❌ Failed: {result["main"]["error_reason"]}</div>', 
-                           unsafe_allow_html=True)
+            if refresh:
+                for u in urls:
+                    recent.evict(canonical_key(u))
+            scraper = MultiScraper(session=http_session())
+            status = st.empty()
+            slots = [st.empty() for _ in urls]
+            for n, (i, result, cached) in enumerate(lookup(scraper, urls, website, recent), 1):
+                status.text(f"Extracted {n}/{len(urls)}")
+                with slots[i].container():
+                    st.markdown(f"**{i + 1}.** {urls[i]}")
+                    if result.ok:
+                        st.session_state.total += 1
+                        st.session_state.history.append({
+                            'name': result.product_name[:30],
+                            'count': '1 product',
+                            'time': datetime.now().strftime('%H:%M')
+                        })
+                        
+                        st.markdown(f'<div class="success-box">✅ Success!{" ⚡ cached" if cached else ""}</div>',
+                                   unsafe_allow_html=True)
+                        st.write(f"**Product:** {result.product_name}")
+                        st.write(f"**Price:** {format_price(result.price, result.currency)}")
+                        st.write(f"**Brand:** {result.brand}")
+                        
+                        if result.specs:
+                            st.markdown("**Specifications:**")
+                            spec_df = pd.DataFrame(result.specs, columns=['specification_name', 'specification_value'])
+                            st.dataframe(spec_df, use_container_width=True, hide_index=True)
+                    else:
+                        st.session_state.failed += 1
+                        st.markdown(f'<div class="error-box">❌ Failed: {result.error_reason}</div>', 
+                                   unsafe_allow_html=True)
+            status.empty()
 
 # BULK MODE
 else:
@@ -371,82 +226,130 @@ else:
     
     if uploaded:
         try:
-            df = pd.read_csv(uploaded) if uploaded.name.endswith('.csv') else pd.read_excel(uploaded)
-            required = ['materialId', 'Source', 'Product URL']
+            df = read_sheet(uploaded, uploaded.name)
             
-            if all(c in df.columns for c in required):
-                c1, c2, c3 = st.columns(3)
-                c1.metric("Products", len(df))
-                c2.metric("Websites", df['Source'].nunique())
-                c3.metric("Est. Time", f"~{len(df)*2//60}m {len(df)*2%60}s")
+            with st.expander("⚙ Concurrency"):
+                a1, a2, a3, a4 = st.columns(4)
+                workers = a1.number_input("Workers", 1, 64, 8)
+                per_domain = a2.number_input("Max parallel per site", 1, 16, 2)
+                delay = a3.number_input("Delay per site (s)", 0.0, 30.0, 2.0, step=0.5)
+                processes = a4.number_input("Parser processes", 0, os.cpu_count() or 1, 0,
+                                            help="0 parses in the fetch threads (one core)")
+            
+            b1, b2, b3 = st.columns([3, 1, 2])
+            cache_mode = b1.radio("Response cache", list(CACHE_MODES), horizontal=True)
+            ttl_hours = b2.number_input("Cache TTL (h)", 0.0, 720.0, 24.0)
+            fmt = FORMATS[b3.radio("Output format", list(FORMATS), horizontal=True)]
+            images_mode = IMAGE_MODES[st.radio("🖼 Images", list(IMAGE_MODES), horizontal=True,
+                                               help="Full-size URLs, duplicates removed, links checked; "
+                                                    "Download also saves them under .sku_images")]
+            delta = st.checkbox("Δ Delta mode: only export products that are new or changed since the last run "
+                                "of this file, plus a Change Log")
+            
+            job = JobStore(job_id_for(uploaded.getvalue()))
+            statuses = job.statuses()
+            keys = sheet_keys(df)
+            run_mode = "Start over"
+            if statuses:
+                n_done = sum(statuses.get(k) == 'Success' for k in keys)
+                n_failed = sum(statuses.get(k) == 'Failed' for k in keys)
+                st.markdown(f'<div class="info-box">♻ Job <b>{job.job_id}</b>: {n_done} done, '
+                           f'{n_failed} failed in previous runs</div>', unsafe_allow_html=True)
+                run_mode = st.radio("Run", list(RUN_MODES), horizontal=True)
+            pending = pending_rows(keys, statuses, RUN_MODES[run_mode])
+            
+            groups = coalesce(df, pending)
+            est = estimate(df, [g[0] for g in groups.values()], delay)
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Products", len(df))
+            c2.metric("Websites", df['Source'].nunique())
+            c3.metric("Saved Fetches", len(pending) - len(groups))
+            c4.metric("Est. Time", f"~{est//60}m {est%60}s")
+            
+            st.dataframe(df.head(5), use_container_width=True, hide_index=True)
+            
+            start = st.button("🚀 START BULK EXTRACTION", use_container_width=True, type="primary")
+            export = statuses and not start and st.button("📦 Export saved results", use_container_width=True)
+            
+            if start or export:
+                writer = ResultWriter(job.export_path(fmt), fmt)
+                if delta:
+                    fingerprints = FingerprintStore()
+                    writer = DeltaWriter(writer, fingerprints, uploaded.name, df['materialId'])
+            
+            if start:
+                cache = ResponseCache(ttl=ttl_hours * 3600, mode=CACHE_MODES[cache_mode])
+                images = None if images_mode == 'off' else ImageStage(
+                    http_session(), ImageStore() if images_mode == 'download' else None)
+                scraper = MultiScraper(cache, session=http_session(),
+                                       parsers=parser_pool(processes) if processes else None, images=images)
                 
-                st.dataframe(df.head(5), use_container_width=True, hide_index=True)
+                progress = st.progress(0)
+                status = st.empty()
+                live = st.empty()
+                perf = st.empty()
                 
-                if st.button("🚀 START BULK EXTRACTION", use_container_width=True, type="primary"):
-                    scraper = MultiScraper()
-                    main_results, all_specs, all_images = [], [], []
-                    
-                    progress = st.progress(0)
-                    status = st.empty()
-                    live = st.empty()
-                    
-                    success = 0
-                    for idx, row in df.iterrows():
-                        status.text(f"Processing {idx+1}/{len(df)}: {row['Source']}")
-                        
-                        result = scraper.scrape(row['materialId'], row['Source'], row['Product URL'])
-                        main_results.append(result['main'])
-                        all_specs.extend(result['specifications'])
-                        all_images.extend(result['images'])
-                        
-                        if result['main']['status'] == 'Success':
-                            success += 1
-                        
-                        live.markdown(f"✅ **{success}** success | ❌ **{idx+1-success}** failed")
-                        progress.progress((idx+1)/len(df))
-                        time.sleep(2)
-                    
-                    st.session_state.total += len(main_results)
-                    st.session_state.failed += (len(main_results) - success)
-                    st.session_state.history.append({
-                        'name': uploaded.name[:25],
-                        'count': f"{success}/{len(main_results)}",
-                        'time': datetime.now().strftime('%H:%M')
-                    })
-                    
-                    st.markdown("### 📊 Extraction Complete")
-                    c1, c2, c3, c4 = st.columns(4)
-                    c1.metric("Total", len(main_results))
-                    c2.metric("✅ Success", success)
-                    c3.metric("❌ Failed", len(main_results)-success)
-                    c4.metric("Rate", f"{success/len(main_results)*100:.1f}%")
-                    
-                    # Excel output
-                    output = BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        pd.DataFrame(main_results).to_excel(writer, sheet_name='Main Results', index=False)
-                        if all_specs:
-                            pd.DataFrame(all_specs).to_excel(writer, sheet_name='Specifications', index=False)
-                        if all_images:
-                            pd.DataFrame(all_images).to_excel(writer, sheet_name='Images', index=False)
-                    output.seek(0)
-                    
+                done, ok = 0, 0
+                for done, total, result in run_job(df, job, scraper, writer, RUN_MODES[run_mode],
+                                                   workers, per_domain, delay, notify=status.text):
+                    if result.ok:
+                        ok += 1
+                    status.text(f"Processed {done}/{total}: {result.source}")
+                    live.markdown(f"✅ **{ok}** success | ❌ **{done-ok}** failed")
+                    progress.progress(done/total)
+                    if done % 10 == 0 or done == total:
+                        perf.dataframe(pd.DataFrame(scraper.stats.summary(), columns=LIVE_STATS),
+                                       use_container_width=True, hide_index=True)
+                progress.progress(1.0)
+                record_stats(scraper, writer)
+                
+                st.session_state.total += done
+                st.session_state.failed += done - ok
+                st.session_state.cache_hits += cache.hits + cache.revalidated
+                st.session_state.cache_misses += cache.misses
+                cache.close()
+                if images:
+                    images.close()
+                st.session_state.history.append({
+                    'name': uploaded.name[:25],
+                    'count': f"{ok}/{done}",
+                    'time': datetime.now().strftime('%H:%M')
+                })
+            elif export:
+                export_saved(job, keys, writer)
+            
+            if start or export:
+                output = writer.close()
+                if delta:
+                    fingerprints.close()
+                    st.info("Δ " + " | ".join(f"{n} {change}" for change, n in writer.changes.items()))
+                total = writer.counts['Main Results']
+                success = writer.success
+                
+                st.markdown("### 📊 Extraction Complete")
+                c1, c2, c3, c4 = st.columns(4)
+                c1.metric("Total", total)
+                c2.metric("✅ Success", success)
+                c3.metric("❌ Failed", total-success)
+                c4.metric("Rate", f"{success/total*100:.1f}%" if total else "-")
+                
+                with open(output, 'rb') as f:
                     st.download_button(
-                        "⬇ Download results.xlsx",
-                        data=output,
-                        file_name=f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        f"⬇ Download results.{output.suffix[1:]}",
+                        data=f,
+                        file_name=f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}{output.suffix}",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                             if fmt == 'xlsx' else "application/zip",
                         use_container_width=True
                     )
-                    
-                    st.info(f"""
-                    📂 **results.xlsx contains:**
-                    - Main Results: {len(main_results)} rows
-                    - Specifications: {len(all_specs)} rows
-                    - Images: {len(all_images)} rows
-                    """)
-            else:
-                st.error("Missing columns")
+                
+                st.info(f"📂 **results{output.suffix} contains:**\n" +
+                        "\n".join(f"- {name}: {writer.counts[name]} rows" for name in SHEETS) +
+                        ("\n- Run Stats: per-site timings" if start else "") +
+                        ("\n- Change Log: new/changed/disappeared/failed" if delta else ""))
+                if start:
+                    st.download_button("📈 Download metrics.prom", scraper.stats.to_prometheus(), "metrics.prom",
+                                       use_container_width=True)
         except Exception as e:
             st.error(f"Error: {str(e)}")
     else:
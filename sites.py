@@ -0,0 +1,248 @@
+"""
+SITES - declarative extractor registry keyed by URL host
+========================================================
+Each supported site is one entry in SITES: which hosts it serves, which
+regions of the page to parse, and where each field lives. extract() turns
+a fetched page into the main/specifications/images record for any entry,
+so adding a site means adding a dict here.
+
+Field specs: {'select': [css, ...], 'pattern': regex}
+  - select None scans the raw page text instead of the soup
+  - the first selected element whose text matches the pattern wins
+  - price, mrp and gst are stored as numbers (records.amount)
+
+A schema.org Product in the page's JSON-LD is used first. The soup is only
+built for whatever it lacks ('hybrid'), or for everything when there is
+none ('html'); each row records its path in extraction_path.
+"""
+
+import re
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from bs4 import SoupStrainer
+
+from parsing import AnyStrainer, has_class, make_soup
+from records import Image, Record, amount
+from structured import find_product
+
+RUPEE = re.compile(r'₹\s*([\d,]+)')
+QUERY = re.compile(r'\?.*')
+
+SITES = {
+    'industrybuying': {
+        'hosts': ['industrybuying.com'],
+        'seller': 'Industry Buying',
+        'label': 'IB',
+        'timeout': 15,
+        'parse_only': AnyStrainer(SoupStrainer(['h1', 'img', 'table']), SoupStrainer(class_=has_class('mrp'))),
+        'name': 'h1',
+        'price': {'select': None, 'pattern': RUPEE},
+        'gst': {'select': None, 'pattern': re.compile(r'(\d+)%\s*GST')},
+        'mrp': {'select': ['.mrp'], 'pattern': RUPEE},
+        'sku': re.compile(r'/([A-Z.0-9]+)/?$'),
+        # Real SKUs only (TOO.ANG.41838870): a bare number ending the slug is not an id
+        'product_id': re.compile(r'[/-]([A-Z]{3}\.[A-Z0-9.]+)/?$'),
+        'images': {'select': 'img', 'limit': 5, 'contains': ['product', 'image'],
+                   'base': 'https://www.industrybuying.com'},
+        'specs': {'rows': 'table tr', 'cells': 'td, th', 'max_key': 100},
+    },
+    'moglix': {
+        'hosts': ['moglix.com'],
+        'seller': 'Moglix',
+        'label': 'Moglix',
+        'timeout': 15,
+        'parse_only': SoupStrainer(['h1', 'img', 'table']),
+        'name': 'h1',
+        'price': {'select': None, 'pattern': RUPEE},
+        'sku': re.compile(r'/mp/([a-z0-9]+)'),
+        'images': {'select': 'img', 'limit': 5, 'contains': ['product', 'moglix'], 'min_len': 11},
+        'specs': {'rows': 'table tr', 'cells': 'td, th', 'max_key': 100},
+    },
+    'amazon': {
+        'hosts': ['amazon.in', 'amazon.com'],
+        'seller': 'Amazon',
+        'label': 'Amazon',
+        'timeout': 20,
+        'strip_query': True,
+        'blocked': {'marker': 'Robot Check', 'status': 503, 'reason': 'Amazon CAPTCHA - retry later'},
+        'parse_only': AnyStrainer(SoupStrainer(id=['productTitle', 'bylineInfo', 'altImages',
+                                                   'productDetails_techSpec_section_1']),
+                                  SoupStrainer(class_=has_class('a-price'))),
+        'name': '#productTitle',
+        'price': {'select': ['.a-price-whole', '.a-price .a-offscreen'], 'pattern': RUPEE},
+        'brand': {'select': ['#bylineInfo'], 'strip': ['Visit the', 'Store']},
+        'sku': re.compile(r'/(?:dp|gp/product)/([A-Z0-9]{10})'),
+        # ._SS40_ / ._AC_US40_ size tokens select a thumbnail rendition; without one the CDN serves full size
+        'images': {'select': '#altImages img', 'limit': 5, 'contains': ['http'], 'exclude': ['sprite'],
+                   'full_size': [(re.compile(r'\._[A-Za-z0-9_,]+_(?=\.\w+$)'), '')]},
+        'specs': {'rows': '#productDetails_techSpec_section_1 tr', 'cells': 'th, td'},
+    },
+}
+
+HOSTS = {host: key for key, site in SITES.items() for host in site['hosts']}
+
+
+def registry_host(url):
+    """The SITES host a URL falls under (subdomains included), or None."""
+    host = urlparse(str(url).strip()).netloc.lower().split(':')[0]
+    while host:
+        if host in HOSTS:
+            return host
+        host = host.partition('.')[2]
+    return None
+
+
+def site_for(url):
+    """Registry key for a URL's host (subdomains included), or None."""
+    return HOSTS.get(registry_host(url))
+
+
+def canonical_key(url):
+    """Identity of the product behind a URL: storefront host + product id (ASIN, /mp/ id, trailing SKU).
+
+    The host, not the site key, scopes the id: amazon.in and amazon.com share ASINs but not
+    prices. Falls back to the URL without query/fragment/trailing slash when no id is found.
+    """
+    host = registry_host(url)
+    key = HOSTS.get(host)
+    parts = urlparse(str(url).strip())
+    if key:
+        site = SITES[key]
+        m = site.get('product_id', site['sku']).search(parts.path)
+        if m:
+            return f"{host}:{m.group(1)}"
+    return f"{key}:{parts.netloc.lower().removeprefix('www.')}{parts.path.rstrip('/')}"
+
+
+def fetch_url(key, url):
+    return QUERY.sub('', url) if SITES[key].get('strip_query') else url
+
+
+def blocked(key, status, content):
+    """Block reason for a response, checked on the raw bytes so no page is decoded just for this."""
+    rule = SITES[key].get('blocked')
+    if rule and (status == rule['status'] or rule['marker'].encode() in content):
+        return rule['reason']
+    return None
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _field(spec, soup, text):
+    if not spec:
+        return 'N/A'
+    sources = [text] if spec['select'] is None else [e.get_text() for e in map(soup.select_one, spec['select']) if e]
+    for source in sources:
+        if 'pattern' not in spec:
+            value = source
+            for junk in spec.get('strip', []):
+                value = value.replace(junk, '')
+            return value.strip()
+        m = spec['pattern'].search(source)
+        if m:
+            return m.group(1)
+    return 'N/A'
+
+
+def _images(spec, soup):
+    images = []
+    for img in soup.select(spec['select'])[:spec['limit']]:
+        src = img.get('src', '')
+        low = src.lower()
+        if not any(s in low for s in spec['contains']) or any(s in low for s in spec.get('exclude', [])):
+            continue
+        if len(src) < spec.get('min_len', 0):
+            continue
+        images.append(Image(_absolute(spec, src)))
+    return images
+
+
+def _absolute(spec, src):
+    return spec['base'] + src if spec.get('base') and not src.startswith('http') else src
+
+
+def _spec_pairs(pairs, max_key=None):
+    return [(k, v) for k, v in pairs if not max_key or (k and v and len(k) < max_key)]
+
+
+def _specs(spec, soup):
+    pairs = []
+    for row in soup.select(spec['rows']):
+        cells = row.select(spec['cells'])
+        if len(cells) >= 2:
+            pairs.append((cells[0].get_text().strip(), cells[1].get_text().strip()))
+    return _spec_pairs(pairs, spec.get('max_key'))
+
+
+def build_record(mid, src, url, seller, fields, specs, images, path='html'):
+    return Record(mid, src, url, 'Success', fields['name'], amount(fields['price']), amount(fields['gst']),
+                  amount(fields['mrp']), fields.get('currency', 'INR'), fields['brand'], fields['sku'], seller,
+                  extraction_path=path, scraped_at=_now(), specs=specs, images=images)
+
+
+def error_record(mid, src, url, reason, category='error'):
+    return Record(mid, src, url, 'Failed', error_reason=reason, error_category=category, scraped_at=_now())
+
+
+def extract(key, mid, src, url, content, text, timings=None):
+    """Build the record for one fetched page. Pure function of its inputs.
+
+    Parse (JSON-LD scan + soup) and extraction seconds are added to `timings` when given.
+    """
+    site = SITES[key]
+    t0 = time.perf_counter()
+    product = find_product(text)
+    soup = make_soup(content, site['parse_only']) if not product or _needs_soup(site, product) else None
+    t1 = time.perf_counter()
+    if product:
+        record = _extract_structured(site, product, soup, mid, src, url, text)
+    else:
+        record = _extract(site, soup, mid, src, url, text)
+    if timings is not None:
+        timings['parse'] = t1 - t0
+        timings['extract'] = time.perf_counter() - t1
+    return record
+
+
+def _sku(site, url):
+    m = site['sku'].search(url)
+    return m.group(1) if m else 'N/A'
+
+
+def _needs_soup(site, product):
+    """True when a field JSON-LD lacks can only come from the DOM."""
+    if not product['price'] or not product['images'] or not product['specs']:
+        return True
+    return any(not product.get(f) and site.get(f) and site[f]['select'] is not None for f in ('mrp', 'brand'))
+
+
+def _extract_structured(site, product, soup, mid, src, url, text):
+    name = product['name']
+    fields = {'name': name, 'sku': _sku(site, url), 'currency': product['currency']}
+    for f in ('price', 'gst', 'mrp', 'brand'):
+        fields[f] = product.get(f) or _field(site.get(f), soup, text)
+    images = ([Image(_absolute(site['images'], u)) for u in product['images'][:site['images']['limit']]]
+              if product['images'] else _images(site['images'], soup))
+    specs = (_spec_pairs(product['specs'], site['specs'].get('max_key')) if product['specs']
+             else _specs(site['specs'], soup))
+    return build_record(mid, src, url, site['seller'], fields, specs, images,
+                        'hybrid' if soup is not None else 'structured')
+
+
+def _extract(site, soup, mid, src, url, text):
+    name = soup.select_one(site['name'])
+    if not name:
+        return error_record(mid, src, url, "Product not found", 'not_found')
+    name = name.get_text().strip()
+
+    fields = {'name': name, 'sku': _sku(site, url)}
+    for f in ('price', 'gst', 'mrp', 'brand'):
+        fields[f] = _field(site.get(f), soup, text)
+
+    images = _images(site['images'], soup)
+    specs = _specs(site['specs'], soup)
+    return build_record(mid, src, url, site['seller'], fields, specs, images)
@@ -0,0 +1,119 @@
+"""
+RUN STATS - per-site stage timings and throughput
+=================================================
+MultiScraper records, per row: time to first byte (includes DNS, connect
+and TLS when the connection is new), body download, lxml parse, field
+extraction and the row total including retries, plus bytes transferred
+and which extraction path (structured/hybrid/html) the row took.
+Summaries give p50/p95/max per stage, path hit rates (% of successful
+rows) and rows/min per site; observed
+throughput is saved so the next run's time estimate uses real numbers.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+STAGES = ['ttfb', 'download', 'parse', 'extract', 'total']
+PATHS = ['structured', 'hybrid', 'html']
+STATS_COLUMNS = (['site', 'rows', 'failed', 'rows_per_min', 'mb'] + [f"{p}_pct" for p in PATHS]
+                 + [f"{s}_{q}" for s in STAGES for q in ('p50', 'p95', 'max')])
+THROUGHPUT_FILE = '.sku_cache/throughput.json'
+
+
+def _pct(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class RunStats:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.samples = defaultdict(lambda: defaultdict(list))
+        self.rows = defaultdict(int)
+        self.failed = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.paths = defaultdict(lambda: defaultdict(int))
+        self.last = {}
+        self.lock = threading.Lock()
+
+    def record(self, site, timings, nbytes=0, ok=True, path=None):
+        with self.lock:
+            self.rows[site] += 1
+            self.failed[site] += not ok
+            self.bytes[site] += nbytes
+            if path:
+                self.paths[site][path] += 1
+            self.last[site] = time.monotonic()
+            for stage, seconds in timings.items():
+                self.samples[site][stage].append(seconds)
+
+    def rows_per_min(self, site):
+        elapsed = self.last.get(site, self.started) - self.started
+        return self.rows[site] / elapsed * 60 if elapsed > 0 else 0.0
+
+    def summary(self):
+        """One row per site; stage times in milliseconds."""
+        out = []
+        with self.lock:
+            for site in sorted(self.rows):
+                row = {'site': site, 'rows': self.rows[site], 'failed': self.failed[site],
+                       'rows_per_min': round(self.rows_per_min(site), 1),
+                       'mb': round(self.bytes[site] / 2**20, 2)}
+                parsed = sum(self.paths[site].values())
+                for p in PATHS:
+                    row[f"{p}_pct"] = round(self.paths[site][p] / parsed * 100, 1) if parsed else 0.0
+                for stage in STAGES:
+                    values = self.samples[site][stage]
+                    for q, v in (('p50', _pct(values, .5)), ('p95', _pct(values, .95)),
+                                 ('max', max(values, default=0.0))):
+                        row[f"{stage}_{q}"] = round(v * 1000, 1)
+                out.append(row)
+        return out
+
+    def to_prometheus(self):
+        lines = ['# TYPE sku_rows_total counter', '# TYPE sku_rows_failed_total counter',
+                 '# TYPE sku_bytes_total counter', '# TYPE sku_extraction_path_total counter',
+                 '# TYPE sku_stage_seconds summary']
+        with self.lock:
+            for site in sorted(self.rows):
+                lines.append(f'sku_rows_total{{site="{site}"}} {self.rows[site]}')
+                lines.append(f'sku_rows_failed_total{{site="{site}"}} {self.failed[site]}')
+                lines.append(f'sku_bytes_total{{site="{site}"}} {self.bytes[site]}')
+                for p in PATHS:
+                    lines.append(f'sku_extraction_path_total{{site="{site}",path="{p}"}} {self.paths[site][p]}')
+                for stage in STAGES:
+                    values = self.samples[site][stage]
+                    for q in (.5, .95):
+                        lines.append(f'sku_stage_seconds{{site="{site}",stage="{stage}",quantile="{q}"}} '
+                                     f'{_pct(values, q):.6f}')
+                    lines.append(f'sku_stage_seconds_sum{{site="{site}",stage="{stage}"}} {sum(values):.6f}')
+                    lines.append(f'sku_stage_seconds_count{{site="{site}",stage="{stage}"}} {len(values)}')
+        return '\n'.join(lines) + '\n'
+
+    def save_throughput(self, path=THROUGHPUT_FILE):
+        known = load_throughput(path)
+        known.update({site: self.rows_per_min(site) for site in self.rows if self.rows[site] >= 5})
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(known, indent=2))
+
+
+def load_throughput(path=THROUGHPUT_FILE):
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def estimate_seconds(site_counts, delay, path=THROUGHPUT_FILE):
+    """Sites run in parallel, so the slowest site bounds the run."""
+    known = load_throughput(path)
+    est = 0.0
+    for site, n in site_counts.items():
+        rate = known.get(site)
+        est = max(est, n / rate * 60 if rate else n * delay)
+    return int(est)
@@ -0,0 +1,93 @@
+"""
+STRUCTURED DATA - schema.org Product from JSON-LD, without a DOM parse
+======================================================================
+The raw page text is scanned for <script type="application/ld+json">
+blocks only; the first Product found is normalised to plain fields.
+Values of an unexpected type are ignored, and a Product that cannot be
+normalised at all counts as no structured data, so the page falls back
+to the soup instead of failing.
+"""
+
+import json
+import re
+
+from records import amount
+
+LD_JSON = re.compile(r'<script[^>]*type\s*=\s*["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
+LIST_PRICE = re.compile(r'ListPrice|StrikethroughPrice|MSRP', re.I)
+
+
+def _price(value):
+    return None if value is None else amount(str(value))
+
+
+def _walk(node):
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+    elif isinstance(node, dict):
+        yield node
+        yield from _walk(node.get('@graph', []))
+
+
+def _is_product(node):
+    kind = node.get('@type')
+    return 'Product' in kind if isinstance(kind, list) else kind == 'Product'
+
+
+def _text(value):
+    if isinstance(value, dict):
+        value = value.get('name')
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return str(value).strip() if value else None
+
+
+def find_product(text):
+    """First schema.org Product on the page as
+    {'name', 'price', 'mrp', 'currency', 'brand', 'images', 'specs'}, or None."""
+    for block in LD_JSON.findall(text):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+        for node in _walk(data):
+            if _is_product(node) and node.get('name'):
+                try:
+                    return _normalise(node)
+                except (AttributeError, TypeError, ValueError):
+                    return None
+    return None
+
+
+def _normalise(node):
+    offers = node.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if not isinstance(offers, dict):
+        offers = {}
+    currency = offers.get('priceCurrency')
+    currency = currency.strip().upper() if isinstance(currency, str) and currency.strip() else 'INR'
+    price = _price(offers.get('price', offers.get('lowPrice')))
+
+    mrp = None
+    specs_ = offers.get('priceSpecification') or []
+    for spec in specs_ if isinstance(specs_, list) else [specs_]:
+        if isinstance(spec, dict) and LIST_PRICE.search(str(spec.get('priceType', ''))):
+            mrp = _price(spec.get('price'))
+
+    images = node.get('image') or []
+    if isinstance(images, (str, dict)):
+        images = [images]
+    if not isinstance(images, list):
+        images = []
+    images = [img.get('url') if isinstance(img, dict) else img for img in images]
+    images = [img.strip() for img in images if isinstance(img, str) and img.strip()]
+
+    props = node.get('additionalProperty') or []
+    specs = [(str(p.get('name', '')).strip(), str(p.get('value', '')).strip())
+             for p in (props if isinstance(props, list) else [props]) if isinstance(p, dict)]
+
+    return {'name': _text(node.get('name')), 'price': price, 'mrp': mrp, 'currency': currency,
+            'brand': _text(node.get('brand')), 'images': images,
+            'specs': [(k, v) for k, v in specs if k and v]}